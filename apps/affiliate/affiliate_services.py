@@ -10,15 +10,33 @@ Services:
 - CacheService: Cache management
 """
 
+import logging
+import time
+
 from django.core.cache import cache
-from django.db.models import Count, Q
+from django.db import connection
+from django.db.models import Count, Max, Prefetch, Q
 from apps.affiliate.models import (
     AffiliateCategory,
+    AffiliatePost,
     AffiliateProduct,
     AffiliateProductCache,
     AffiliateProductFilter,
 )
 
+logger = logging.getLogger(__name__)
+
+# Hierarchy cache version = max(updated_at) of active categories. The
+# aggregate itself is memoized in-process for a few seconds so bursts of
+# page loads don't re-run it.
+_HIERARCHY_TIMEOUT = 3600  # 1 hour safety net
+_HIERARCHY_VERSION_TTL = 5  # seconds
+_hierarchy_version = {"version": None, "checked_at": 0.0}
+
+# Buffered view counters - flushed to the DB by core.tasks.flush_view_counts
+_VIEW_COUNT_PREFIX = "post_views:"
+_VIEW_COUNT_TTL = 3600  # survives several missed flush runs
+
 
 class CategoryService:
     """
@@ -52,10 +70,22 @@ class CategoryService:
         if featured_only:
             queryset = queryset.filter(is_featured=True)
 
-        return queryset.annotate(post_count=Count("posts")).order_by(
-            "-is_featured", "display_order"
+        # Prefetch active children in one extra query so get_children()
+        # doesn't fire per-row (avoids N+1 in navigation rendering)
+        queryset = queryset.prefetch_related(
+            Prefetch(
+                "children",
+                queryset=AffiliateCategory.objects.filter(status="ACTIVE").order_by(
+                    "display_order"
+                ),
+                to_attr="active_children",
+            )
         )
 
+        return queryset.annotate(
+            post_count=Count("posts", filter=Q(posts__status="PUBLISHED"))
+        ).order_by("-is_featured", "display_order")
+
     @staticmethod
     def get_category_with_products(category_slug):
         """
@@ -68,8 +98,25 @@ class CategoryService:
             dict with category data and products
         """
         try:
-            category = AffiliateCategory.objects.get(
-                slug=category_slug, status="ACTIVE"
+            # Eager-load the O2O cache plus children and published posts so
+            # the page renders from a single fetch instead of 4+ queries
+            category = (
+                AffiliateCategory.objects.select_related("affiliate_product_cache")
+                .prefetch_related(
+                    Prefetch(
+                        "children",
+                        queryset=AffiliateCategory.objects.filter(status="ACTIVE"),
+                        to_attr="active_children",
+                    ),
+                    Prefetch(
+                        "posts",
+                        queryset=AffiliatePost.objects.filter(
+                            status="PUBLISHED"
+                        ).order_by("-published_at"),
+                        to_attr="recent_posts",
+                    ),
+                )
+                .get(slug=category_slug, status="ACTIVE")
             )
         except AffiliateCategory.DoesNotExist:
             return None
@@ -77,15 +124,14 @@ class CategoryService:
         # Get products from cache
         products = ProductService.get_category_products(category)
 
-        # Build response
+        # Build response (children and posts come from the prefetch; the
+        # count reads the denormalized field instead of len(products))
         return {
             "category": category,
             "products": products,
-            "product_count": len(products),
-            "subcategories": category.get_children(),
-            "posts": category.posts.filter(status="PUBLISHED").order_by(
-                "-published_at"
-            )[:6],
+            "product_count": category.get_product_count(),
+            "subcategories": category.active_children,
+            "posts": category.recent_posts[:6],
         }
 
     @staticmethod
@@ -93,25 +139,72 @@ class CategoryService:
         """
         Get full category hierarchy (for navigation).
 
+        Rendered on essentially every page but changes rarely, so the
+        result is cached keyed on max(updated_at) of active categories -
+        it's recomputed at most once per category mutation.
+
         Returns:
             List of parent categories with children
         """
-        parents = AffiliateCategory.objects.filter(
-            status="ACTIVE", parent__isnull=True
-        ).order_by("display_order")
+        now = time.monotonic()
+        if now - _hierarchy_version["checked_at"] > _HIERARCHY_VERSION_TTL:
+            _hierarchy_version["version"] = AffiliateCategory.objects.filter(
+                status="ACTIVE"
+            ).aggregate(v=Max("updated_at"))["v"]
+            _hierarchy_version["checked_at"] = now
+
+        version = _hierarchy_version["version"]
+        cache_key = f"cat_hierarchy:{version.timestamp() if version else 0}"
+
+        return cache.get_or_set(
+            cache_key, CategoryService._build_hierarchy, _HIERARCHY_TIMEOUT
+        )
+
+    @staticmethod
+    def _build_hierarchy():
+        """Build the parent/children hierarchy list (cache miss path)."""
+        # Navigation only needs naming/ordering columns - skip the SEO
+        # and description text to keep rows narrow
+        nav_fields = ("id", "name", "slug", "parent_id", "display_order", "is_featured")
+
+        parents = (
+            AffiliateCategory.objects.filter(status="ACTIVE", parent__isnull=True)
+            .only(*nav_fields)
+            .prefetch_related(
+                Prefetch(
+                    "children",
+                    queryset=AffiliateCategory.objects.filter(status="ACTIVE")
+                    .only(*nav_fields)
+                    .order_by("display_order"),
+                    to_attr="active_children",
+                )
+            )
+            .order_by("display_order")
+        )
 
+        # Children come from the prefetched attribute - 2 queries total,
+        # regardless of how many parents there are
         hierarchy = []
         for parent in parents:
             hierarchy.append(
                 {
                     "parent": parent,
-                    "children": parent.get_children(),
+                    "children": parent.active_children,
                 }
             )
 
         return hierarchy
 
 
+# Two-tier product list cache:
+# L1 = in-process dict (no network hop), L2 = Django cache (Redis in prod).
+# Keys include the cache row's last_updated timestamp, so a refresh rolls
+# the key forward and stale entries simply age out via TTL.
+_product_list_l1 = {}
+_PRODUCT_L1_MAX_ENTRIES = 256
+_PRODUCT_L2_TIMEOUT = 3600  # 1 hour
+
+
 class ProductService:
     """
     Product business logic.
@@ -119,12 +212,27 @@ class ProductService:
     CORE FEATURE: Get products from cache, not API!
     """
 
+    # Columns a product card actually renders - everything else (raw_data
+    # JSON in particular) stays in the database
+    CARD_FIELDS = (
+        "asin",
+        "title",
+        "url",
+        "price_gbp",
+        "rating",
+        "review_count",
+        "image_url",
+        "in_stock",
+    )
+
     @staticmethod
     def get_category_products(category, limit=None):
         """
         Get eligible products for a category from cache.
 
         CORE: This retrieves from AffiliateProductCache, NOT the API!
+        Materialized product lists are served from an L1 (in-process) /
+        L2 (Redis) cache, so repeat page loads skip the DB entirely.
 
         Args:
             category: AffiliateCategory instance
@@ -134,8 +242,27 @@ class ProductService:
             List of AffiliateProduct instances
         """
         try:
-            cache = category.affiliate_product_cache
-            products = cache.get_products()
+            cache_obj = category.affiliate_product_cache
+
+            cache_key = (
+                f"cat_products:{category.id}:{cache_obj.last_updated.timestamp()}"
+            )
+
+            # L1: in-process
+            products = _product_list_l1.get(cache_key)
+
+            if products is None:
+                # L2: shared cache (Redis in production)
+                products = cache.get(cache_key)
+
+                if products is None:
+                    products = list(cache_obj.get_products())
+                    cache.set(cache_key, products, _PRODUCT_L2_TIMEOUT)
+
+                # Bound L1 size - old keys die with the refresh anyway
+                if len(_product_list_l1) >= _PRODUCT_L1_MAX_ENTRIES:
+                    _product_list_l1.clear()
+                _product_list_l1[cache_key] = products
 
             if limit:
                 products = products[:limit]
@@ -146,10 +273,111 @@ class ProductService:
             # No cache for this category - return empty
             return []
         except Exception as e:
-            # Log error but don't crash
-            print(f"Error getting products for {category.name}: {e}")
+            # Log error but don't crash (lazy %s formatting - the string
+            # is only built if the record is actually emitted)
+            logger.error("Error getting products for %s: %s", category.name, e)
             return []
 
+    @staticmethod
+    def bulk_get_category_products(categories, limit=None):
+        """
+        Get cached product lists for many categories at once.
+
+        Uses cache.get_many (a single Redis MGET) instead of one
+        round-trip per category, and refills any misses with set_many.
+        Callers should load categories with
+        select_related('affiliate_product_cache').
+
+        Args:
+            categories: Iterable of AffiliateCategory instances
+            limit: Max products per category
+
+        Returns:
+            dict mapping category id -> list of AffiliateProduct
+        """
+        results = {}
+        key_map = {}
+
+        for category in categories:
+            try:
+                cache_obj = category.affiliate_product_cache
+            except AffiliateProductCache.DoesNotExist:
+                results[category.id] = []
+                continue
+            cache_key = (
+                f"cat_products:{category.id}:{cache_obj.last_updated.timestamp()}"
+            )
+            key_map[cache_key] = category
+
+        cached = cache.get_many(list(key_map))
+
+        refill = {}
+        for cache_key, category in key_map.items():
+            if cache_key in cached:
+                results[category.id] = cached[cache_key]
+            else:
+                products = list(category.affiliate_product_cache.get_products())
+                results[category.id] = products
+                refill[cache_key] = products
+
+        if refill:
+            cache.set_many(refill, _PRODUCT_L2_TIMEOUT)
+
+        if limit:
+            results = {
+                category_id: products[:limit]
+                for category_id, products in results.items()
+            }
+
+        return results
+
+    @staticmethod
+    def attach_featured_products(posts, limit=4):
+        """
+        Batch-hydrate featured products for a list of posts.
+
+        Collects the cached ASINs of every post's category, fetches all
+        the products in ONE query, and stashes each post's slice on the
+        instance so get_featured_products() does dict lookups instead of
+        firing cache + product queries per post.
+
+        Args:
+            posts: Iterable of AffiliatePost (with
+                   category__affiliate_product_cache select_related)
+            limit: Max products per post
+
+        Returns:
+            List of posts with _featured_products attached
+        """
+        posts = list(posts)
+
+        post_asins = {}
+        all_asins = set()
+        for post in posts:
+            try:
+                cache_obj = post.category.affiliate_product_cache
+                asins = (cache_obj.cached_asins or [])[:limit]
+            except AffiliateProductCache.DoesNotExist:
+                asins = []
+            post_asins[post.pk] = asins
+            all_asins.update(asins)
+
+        product_map = {
+            product.asin: product
+            for product in AffiliateProduct.objects.filter(
+                asin__in=all_asins, status="ACTIVE"
+            ).only(*ProductService.CARD_FIELDS)
+        }
+
+        for post in posts:
+            post._featured_products = [
+                product_map[asin]
+                for asin in post_asins[post.pk]
+                if asin in product_map
+            ]
+
+        return posts
+
     @staticmethod
     def get_product_details(asin):
         """
@@ -171,15 +399,35 @@ class ProductService:
         """
         Search products by title.
 
+        On PostgreSQL this uses pg_trgm similarity (backed by the GIN
+        index on title) instead of an unindexable ILIKE '%...%' scan.
+        Other backends (SQLite in dev) fall back to icontains.
+
         Args:
             query: Search string
 
         Returns:
             QuerySet of matching products
         """
-        return AffiliateProduct.objects.filter(
-            Q(title__icontains=query), status="ACTIVE", in_stock=True
-        ).order_by("-rating", "-review_count")[:10]
+        if connection.vendor == "postgresql":
+            from django.contrib.postgres.search import TrigramSimilarity
+
+            return (
+                AffiliateProduct.objects.annotate(
+                    similarity=TrigramSimilarity("title", query)
+                )
+                .filter(similarity__gt=0.1, status="ACTIVE", in_stock=True)
+                .only(*ProductService.CARD_FIELDS)
+                .order_by("-similarity", "-rating")[:10]
+            )
+
+        return (
+            AffiliateProduct.objects.filter(
+                Q(title__icontains=query), status="ACTIVE", in_stock=True
+            )
+            .only(*ProductService.CARD_FIELDS)
+            .order_by("-rating", "-review_count")[:10]
+        )
 
     @staticmethod
     def get_top_products(limit=10):
@@ -192,9 +440,11 @@ class ProductService:
         Returns:
             List of top products
         """
-        return AffiliateProduct.objects.filter(status="ACTIVE", in_stock=True).order_by(
-            "-rating", "-review_count"
-        )[:limit]
+        return (
+            AffiliateProduct.objects.filter(status="ACTIVE", in_stock=True)
+            .only(*ProductService.CARD_FIELDS)
+            .order_by("-rating", "-review_count")[:limit]
+        )
 
 
 class CacheService:
@@ -218,13 +468,12 @@ class CacheService:
         Returns:
             bool: True if cache is fresh
         """
-        if not cache_obj.is_fresh:
-            return False
-
-        if not cache_obj.cached_asins or len(cache_obj.cached_asins) == 0:
-            return False
-
-        return cache_obj.is_cache_stale() is False
+        # Short-circuit: cheapest checks first, no list materialization
+        return (
+            cache_obj.is_fresh
+            and bool(cache_obj.cached_asins)
+            and not cache_obj.is_cache_stale()
+        )
 
     @staticmethod
     def refresh_cache(category):
@@ -239,7 +488,7 @@ class CacheService:
         """
         try:
             cache_obj = category.affiliate_product_cache
-        except:
+        except AffiliateProductCache.DoesNotExist:
             return {"success": False, "error": "No cache found"}
 
         # This would be called from Celery task
@@ -265,13 +514,14 @@ class CacheService:
         Returns:
             List of fallback products
         """
-        # Try parent category
+        # Try parent category (already in memory when the caller loaded
+        # the category with select_related('parent__affiliate_product_cache'))
         if category.parent:
             try:
                 parent_cache = category.parent.affiliate_product_cache
                 if parent_cache.cached_asins:
                     return parent_cache.get_products()[:limit]
-            except:
+            except AffiliateProductCache.DoesNotExist:
                 pass
 
         # Fallback to top-rated products overall
@@ -316,6 +566,85 @@ class FilterService:
 
         return True
 
+    @staticmethod
+    def compile_predicate(filter_rules):
+        """
+        Build a specialized predicate from filter rules.
+
+        Binds the rule values to plain local floats/ints once, so the
+        per-product checks inside a refresh loop skip repeated model
+        attribute lookups and Decimal coercion. Prefer filter_queryset
+        when the predicates can be pushed into SQL.
+
+        Args:
+            filter_rules: AffiliateProductFilter instance
+
+        Returns:
+            Callable taking an AffiliateProduct, returning bool
+        """
+        min_rating = float(filter_rules.min_rating)
+        min_reviews = int(filter_rules.min_review_count)
+        in_stock_only = bool(filter_rules.in_stock_only)
+        min_price = filter_rules.min_price
+        max_price = filter_rules.max_price
+
+        def check(product):
+            rating = product.rating
+            if rating is None or rating < min_rating:
+                return False
+            if product.review_count < min_reviews:
+                return False
+            if in_stock_only and not product.in_stock:
+                return False
+            price = product.price_gbp
+            if price:
+                if min_price is not None and price < min_price:
+                    return False
+                if max_price is not None and price > max_price:
+                    return False
+            return True
+
+        return check
+
+    @staticmethod
+    def filter_queryset(queryset, filter_rules):
+        """
+        Apply filter rules to a whole queryset in one SQL query.
+
+        Batched counterpart to apply_filter_rules - pushes every predicate
+        into the database (using the rating/review_count and stock indexes)
+        instead of looping rows in Python.
+
+        Args:
+            queryset: AffiliateProduct queryset
+            filter_rules: AffiliateProductFilter instance
+
+        Returns:
+            Filtered QuerySet
+        """
+        queryset = queryset.filter(
+            rating__gte=filter_rules.min_rating,
+            review_count__gte=filter_rules.min_review_count,
+        )
+
+        if filter_rules.in_stock_only:
+            queryset = queryset.filter(in_stock=True)
+
+        # Price bounds compare the indexed integer-pence mirror (cheap
+        # 64-bit compares) and only apply to products with a known price
+        if filter_rules.min_price is not None:
+            min_pence = int(filter_rules.min_price * 100)
+            queryset = queryset.filter(
+                Q(price_gbp_pence__gte=min_pence) | Q(price_gbp_pence__isnull=True)
+            )
+        if filter_rules.max_price is not None:
+            max_pence = int(filter_rules.max_price * 100)
+            queryset = queryset.filter(
+                Q(price_gbp_pence__lte=max_pence) | Q(price_gbp_pence__isnull=True)
+            )
+
+        return queryset
+
     @staticmethod
     def get_filter_rules(category):
         """
@@ -329,7 +658,7 @@ class FilterService:
         """
         try:
             return category.filter_rules
-        except:
+        except AffiliateProductFilter.DoesNotExist:
             # Return default filter
             return AffiliateProductFilter(
                 category=category,
@@ -339,9 +668,39 @@ class FilterService:
             )
 
 
+def record_post_view(post_id):
+    """
+    Record one blog post view without a synchronous DB write.
+
+    On a backend that can enumerate keys (django-redis), the view lands
+    as a cache counter and core.tasks.flush_view_counts folds the
+    buffered counters into view_count in bulk. On backends that can't
+    (LocMemCache in dev), fall back to the direct F() update.
+
+    Args:
+        post_id: AffiliatePost primary key
+    """
+    if hasattr(cache, "keys"):
+        key = f"{_VIEW_COUNT_PREFIX}{post_id}"
+        # add() is atomic, so exactly one request creates the counter;
+        # everyone else increments it
+        if not cache.add(key, 1, _VIEW_COUNT_TTL):
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Counter expired/flushed between add() and incr()
+                cache.add(key, 1, _VIEW_COUNT_TTL)
+        return
+
+    from django.db.models import F
+
+    AffiliatePost.objects.filter(pk=post_id).update(view_count=F("view_count") + 1)
+
+
 __all__ = [
     "CategoryService",
     "ProductService",
     "CacheService",
     "FilterService",
+    "record_post_view",
 ]
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AffiliateConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.affiliate"
+
+    def ready(self):
+        # Register cache-invalidation signal receivers
+        from apps.affiliate import signals  # noqa: F401
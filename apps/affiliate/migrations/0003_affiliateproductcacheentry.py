@@ -0,0 +1,30 @@
+# Generated by Django 5.2.17 on 2026-08-31 12:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('affiliate', '0002_product_title_trgm_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AffiliateProductCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.IntegerField(help_text='Display order within the cache')),
+                ('cache', models.ForeignKey(help_text='Cache this entry belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='affiliate.affiliateproductcache')),
+                ('product', models.ForeignKey(help_text='Cached product', on_delete=django.db.models.deletion.CASCADE, related_name='cache_entries', to='affiliate.affiliateproduct')),
+            ],
+            options={
+                'verbose_name': 'Affiliate Product Cache Entry',
+                'verbose_name_plural': 'Affiliate Product Cache Entries',
+                'ordering': ['cache', 'position'],
+                'indexes': [models.Index(fields=['cache', 'position'], name='affiliate_a_cache_i_4da4ae_idx')],
+                'unique_together': {('cache', 'position')},
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-31 12:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('affiliate', '0003_affiliateproductcacheentry'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='affiliatepost',
+            index=models.Index(condition=models.Q(('status', 'PUBLISHED')), fields=['-published_at'], name='post_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='affiliateproduct',
+            index=models.Index(condition=models.Q(('in_stock', True), ('status', 'ACTIVE')), fields=['-rating', '-review_count'], name='prod_top_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.17 on 2026-08-31 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('affiliate', '0004_affiliatepost_post_published_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='affiliateproduct',
+            name='price_gbp_pence',
+            field=models.PositiveIntegerField(blank=True, help_text='Price in integer pence (kept in sync with price_gbp; used for cheap range comparisons)', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='affiliateproduct',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['price_gbp_pence'], name='prod_price_pence_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+from django.db.models import F, IntegerField
+from django.db.models.functions import Cast
+
+
+def backfill_pence(apps, schema_editor):
+    """Populate price_gbp_pence from the existing Decimal prices."""
+    AffiliateProduct = apps.get_model("affiliate", "AffiliateProduct")
+    AffiliateProduct.objects.exclude(price_gbp=None).update(
+        price_gbp_pence=Cast(F("price_gbp") * 100, output_field=IntegerField())
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("affiliate", "0005_affiliateproduct_price_gbp_pence_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_pence, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create pg_trgm GIN indexes for the search view (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS affiliate_category_name_trgm "
+        "ON affiliate_affiliatecategory USING gin (name gin_trgm_ops);"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS affiliate_category_description_trgm "
+        "ON affiliate_affiliatecategory USING gin (description gin_trgm_ops);"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS affiliate_post_title_trgm "
+        "ON affiliate_affiliatepost USING gin (title gin_trgm_ops);"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS affiliate_post_excerpt_trgm "
+        "ON affiliate_affiliatepost USING gin (excerpt gin_trgm_ops);"
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS affiliate_category_name_trgm;")
+    schema_editor.execute("DROP INDEX IF EXISTS affiliate_category_description_trgm;")
+    schema_editor.execute("DROP INDEX IF EXISTS affiliate_post_title_trgm;")
+    schema_editor.execute("DROP INDEX IF EXISTS affiliate_post_excerpt_trgm;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("affiliate", "0006_backfill_price_gbp_pence"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
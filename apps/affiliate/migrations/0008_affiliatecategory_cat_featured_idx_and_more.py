@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-31 12:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('affiliate', '0007_search_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='affiliatecategory',
+            index=models.Index(condition=models.Q(('parent__isnull', True), ('status', 'ACTIVE')), fields=['-is_featured', 'display_order'], name='cat_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='affiliatepost',
+            index=models.Index(condition=models.Q(('status', 'PUBLISHED')), fields=['category', '-published_at'], name='post_cat_pub_idx'),
+        ),
+    ]
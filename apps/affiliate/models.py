@@ -109,6 +109,13 @@ class AffiliateCategory(models.Model):
             models.Index(fields=["slug"]),
             models.Index(fields=["status", "display_order"]),
             models.Index(fields=["parent", "status"]),
+            # Partial index matching the top-level category listings:
+            # WHERE status/parent ORDER BY -is_featured, display_order
+            models.Index(
+                fields=["-is_featured", "display_order"],
+                name="cat_featured_idx",
+                condition=models.Q(status="ACTIVE", parent__isnull=True),
+            ),
         ]
 
     def __str__(self):
@@ -126,18 +133,56 @@ class AffiliateCategory(models.Model):
         return f"/affiliate/{self.slug}/"
 
     def get_children(self):
-        """Get all subcategories"""
+        """Get all subcategories (uses prefetched list when available)"""
+        active_children = getattr(self, "active_children", None)
+        if active_children is not None:
+            return active_children
         return self.children.filter(status="ACTIVE")
 
+    @classmethod
+    def build_children_map(cls):
+        """
+        Load the whole active tree in one query and group it by parent.
+
+        Returns a {parent_id: [children...]} dict (root nodes under None),
+        ordered by display_order within each parent. Walking this map in
+        Python replaces one query per node when serializing nested trees.
+        """
+        categories = (
+            cls.objects.filter(status="ACTIVE")
+            .select_related("affiliate_product_cache")
+            .order_by("parent_id", "display_order")
+        )
+
+        children_by_parent = {}
+        for category in categories:
+            children_by_parent.setdefault(category.parent_id, []).append(category)
+        return children_by_parent
+
     def get_product_count(self):
         """Get count of cached products for this category"""
         try:
-            cache = self.affiliate_product_cache
-            return len(cache.cached_asins) if cache.cached_asins else 0
-        except:
+            # Read the denormalized counter - no need to hydrate the
+            # JSON ASIN list just to count it
+            return self.affiliate_product_cache.product_count
+        except AffiliateProductCache.DoesNotExist:
             return 0
 
 
+class AffiliateProductManager(models.Manager):
+    """
+    Default product manager that defers the raw_data JSON blob.
+
+    raw_data holds the full Amazon API response (often many KB per row)
+    and is only needed during refresh - normal reads shouldn't ship it
+    from the database. Use AffiliateProduct.objects_with_raw when the
+    blob is actually required.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().defer("raw_data")
+
+
 class AffiliateProduct(models.Model):
     """
     Amazon product details.
@@ -162,6 +207,12 @@ class AffiliateProduct(models.Model):
     price_gbp = models.DecimalField(
         max_digits=10, decimal_places=2, null=True, blank=True, help_text="Price in GBP"
     )
+    price_gbp_pence = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Price in integer pence (kept in sync with price_gbp; "
+        "used for cheap range comparisons)",
+    )
     price_original = models.DecimalField(
         max_digits=10,
         decimal_places=2,
@@ -234,6 +285,11 @@ class AffiliateProduct(models.Model):
         null=True, blank=True, help_text="Full API response from Amazon"
     )
 
+    # Default manager defers raw_data; refresh paths that need the full
+    # API response use objects_with_raw
+    objects = AffiliateProductManager()
+    objects_with_raw = models.Manager()
+
     class Meta:
         ordering = ["-rating", "-review_count"]
         verbose_name = "Affiliate Product"
@@ -243,11 +299,43 @@ class AffiliateProduct(models.Model):
             models.Index(fields=["status", "in_stock"]),
             models.Index(fields=["rating", "review_count"]),
             models.Index(fields=["-added_date"]),
+            # Partial index matching get_top_products exactly: the LIMIT
+            # becomes an index range scan with no sort
+            models.Index(
+                fields=["-rating", "-review_count"],
+                name="prod_top_idx",
+                condition=models.Q(status="ACTIVE", in_stock=True),
+            ),
+            # Integer-pence price for indexed range scans in filters
+            models.Index(
+                fields=["price_gbp_pence"],
+                name="prod_price_pence_idx",
+                condition=models.Q(status="ACTIVE"),
+            ),
         ]
 
     def __str__(self):
         return f"{self.title} ({self.asin})"
 
+    def save(self, *args, **kwargs):
+        # Keep the integer-pence mirror in sync with the Decimal price.
+        # Coerce through Decimal first: callers assign strings and floats
+        # too, where naive int(x * 100) repeats the string or truncates
+        # (int(12.34 * 100) == 1233).
+        if self.price_gbp is not None:
+            self.price_gbp_pence = int(
+                (Decimal(str(self.price_gbp)) * 100).to_integral_value()
+            )
+        else:
+            self.price_gbp_pence = None
+
+        # A save(update_fields=["price_gbp"]) must persist the mirror too
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "price_gbp" in update_fields:
+            kwargs["update_fields"] = set(update_fields) | {"price_gbp_pence"}
+
+        super().save(*args, **kwargs)
+
     def meets_filter_criteria(self, filter_rules):
         """
         Check if this product meets filter criteria.
@@ -434,18 +522,56 @@ class AffiliateProductCache(models.Model):
     def get_products(self):
         """
         Get actual Product objects from cached ASINs.
-        Returns products in order (for consistent display).
+        Returns an ordered QuerySet (cached ASIN order), so results stay
+        lazy and sliceable downstream.
+
+        Prefers the AffiliateProductCacheEntry through-table (a single
+        indexed JOIN); falls back to the JSON ASIN list for caches that
+        have not been refreshed since the through-table was introduced.
         """
+        entries = AffiliateProduct.objects.filter(
+            cache_entries__cache=self, status="ACTIVE"
+        ).order_by("cache_entries__position")
+
+        if entries.exists():
+            return entries
+
         if not self.cached_asins:
             return AffiliateProduct.objects.none()
 
-        # Preserve order of ASINs
+        # Legacy path: preserve order of the JSON ASIN list via CASE WHEN
         asins = self.cached_asins
-        products = AffiliateProduct.objects.filter(asin__in=asins, status="ACTIVE")
+        preserved_order = models.Case(
+            *[models.When(asin=asin, then=i) for i, asin in enumerate(asins)],
+            output_field=models.IntegerField(),
+        )
+        return (
+            AffiliateProduct.objects.filter(asin__in=asins, status="ACTIVE")
+            .annotate(_cached_order=preserved_order)
+            .order_by("_cached_order")
+        )
+
+    def replace_entries(self, asins):
+        """
+        Rewrite the through-table entries to match an ordered ASIN list.
 
-        # Sort by original order
-        preserved_order = {asin: i for i, asin in enumerate(asins)}
-        return sorted(products, key=lambda x: preserved_order.get(x.asin, 999))
+        Only ASINs with a local AffiliateProduct row get an entry; unknown
+        ASINs remain available via cached_asins until products sync.
+        """
+        product_ids = dict(
+            AffiliateProduct.objects.filter(asin__in=asins).values_list("asin", "id")
+        )
+
+        self.entries.all().delete()
+        AffiliateProductCacheEntry.objects.bulk_create(
+            [
+                AffiliateProductCacheEntry(
+                    cache=self, product_id=product_ids[asin], position=position
+                )
+                for position, asin in enumerate(asins)
+                if asin in product_ids
+            ]
+        )
 
     def is_cache_stale(self):
         """Check if cache needs refreshing"""
@@ -456,6 +582,42 @@ class AffiliateProductCache(models.Model):
         return False
 
 
+class AffiliateProductCacheEntry(models.Model):
+    """
+    One row per cached product per category cache, with display position.
+
+    Normalizes the cached_asins JSON list so get_products() can be a
+    single ordered JOIN and refreshes can patch individual rows instead
+    of rewriting the whole JSON blob.
+    """
+
+    cache = models.ForeignKey(
+        AffiliateProductCache,
+        on_delete=models.CASCADE,
+        related_name="entries",
+        help_text="Cache this entry belongs to",
+    )
+    product = models.ForeignKey(
+        AffiliateProduct,
+        on_delete=models.CASCADE,
+        related_name="cache_entries",
+        help_text="Cached product",
+    )
+    position = models.IntegerField(help_text="Display order within the cache")
+
+    class Meta:
+        ordering = ["cache", "position"]
+        unique_together = ["cache", "position"]
+        verbose_name = "Affiliate Product Cache Entry"
+        verbose_name_plural = "Affiliate Product Cache Entries"
+        indexes = [
+            models.Index(fields=["cache", "position"]),
+        ]
+
+    def __str__(self):
+        return f"{self.cache.category.name} #{self.position}: {self.product.asin}"
+
+
 class AffiliatePost(models.Model):
     """
     Blog posts and guide content for affiliate traffic.
@@ -555,6 +717,18 @@ class AffiliatePost(models.Model):
             models.Index(fields=["category", "status"]),
             models.Index(fields=["-published_at"]),
             models.Index(fields=["status"]),
+            # Partial index for published-post listings ordered by recency
+            models.Index(
+                fields=["-published_at"],
+                name="post_published_idx",
+                condition=models.Q(status="PUBLISHED"),
+            ),
+            # Category-filtered blog listing: WHERE category ORDER BY recency
+            models.Index(
+                fields=["category", "-published_at"],
+                name="post_cat_pub_idx",
+                condition=models.Q(status="PUBLISHED"),
+            ),
         ]
 
     def __str__(self):
@@ -576,6 +750,12 @@ class AffiliatePost(models.Model):
 
     def get_featured_products(self, limit=4):
         """Get featured products from this post's category"""
+        # List views batch-hydrate this via
+        # ProductService.attach_featured_products - use it when present
+        prefetched = getattr(self, "_featured_products", None)
+        if prefetched is not None:
+            return prefetched[:limit]
+
         try:
             cache = self.category.affiliate_product_cache
             products = cache.get_products()[:limit]
@@ -589,5 +769,6 @@ __all__ = [
     "AffiliateProduct",
     "AffiliateProductFilter",
     "AffiliateProductCache",
+    "AffiliateProductCacheEntry",
     "AffiliatePost",
 ]
@@ -6,7 +6,7 @@ Data serialization for API and form handling.
 
 from rest_framework import serializers
 from django import forms
-from django.db.models import Count
+from django.db.models import Count, Prefetch, Q
 from apps.affiliate.models import AffiliateCategory, AffiliateProduct, AffiliatePost
 
 
@@ -28,7 +28,25 @@ class CategorySerializer(serializers.ModelSerializer):
     children = serializers.SerializerMethodField()
     product_count = serializers.SerializerMethodField()
     post_count = serializers.SerializerMethodField()
-    absolute_url = serializers.SerializerMethodField()
+    # get_absolute_url is a plain f-string on the model (no reverse()
+    # resolver walk), so a direct read beats a method-field hop per row
+    absolute_url = serializers.ReadOnlyField(source="get_absolute_url")
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Declare the data this serializer reads beyond the base row.
+
+        get_product_count touches the one-to-one cache and get_post_count
+        prefers the published_post_count annotation - wiring both here
+        means any view serializing categories stays N+1-free by calling
+        this instead of duplicating the joins.
+        """
+        return queryset.select_related("affiliate_product_cache").annotate(
+            published_post_count=Count(
+                "posts", filter=Q(posts__status="PUBLISHED")
+            )
+        )
 
     class Meta:
         model = AffiliateCategory
@@ -49,27 +67,36 @@ class CategorySerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
     def get_children(self, obj):
-        """Get nested children"""
-        children = obj.get_children()
-        if children.exists():
-            return CategorySerializer(children, many=True).data
-        return []
+        """Get nested children (from the pre-walked tree when available)"""
+        children_by_parent = self.context.get("children_by_parent")
+        if children_by_parent is not None:
+            children = children_by_parent.get(obj.id, [])
+        else:
+            children = list(obj.get_children())
+
+        # Recurse through this instance's to_representation instead of
+        # constructing a fresh serializer (and its whole field set) per
+        # tree level - same output, none of the per-node __init__ cost
+        return [self.to_representation(child) for child in children]
 
     def get_product_count(self, obj):
         """Get number of products in cache"""
-        try:
-            return obj.affiliate_product_cache.product_count
-        except:
-            return 0
+        # getattr instead of try/except - no exception construction on
+        # the miss path, and free when select_related loaded the cache
+        product_cache = getattr(obj, "affiliate_product_cache", None)
+        return product_cache.product_count if product_cache is not None else 0
 
     def get_post_count(self, obj):
-        """Get number of posts"""
+        """Get number of posts (annotation or pre-computed map, no query)"""
+        annotated = getattr(obj, "published_post_count", None)
+        if annotated is not None:
+            return annotated
+
+        post_counts = self.context.get("post_counts")
+        if post_counts is not None:
+            return post_counts.get(obj.id, 0)
         return obj.posts.filter(status="PUBLISHED").count()
 
-    def get_absolute_url(self, obj):
-        """Get absolute URL"""
-        return obj.get_absolute_url()
-
 
 class ProductSerializer(serializers.ModelSerializer):
     """
@@ -84,6 +111,21 @@ class ProductSerializer(serializers.ModelSerializer):
 
     category_names = serializers.SerializerMethodField()
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Prefetch the category names this serializer renders.
+
+        Call on any queryset serialized with many=True - a page of
+        products becomes 2 queries instead of 1+N M2M lookups.
+        """
+        return queryset.prefetch_related(
+            Prefetch(
+                "categories",
+                queryset=AffiliateCategory.objects.only("id", "name"),
+            )
+        )
+
     class Meta:
         model = AffiliateProduct
         fields = [
@@ -103,7 +145,7 @@ class ProductSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
     def get_category_names(self, obj):
-        """Get category names"""
+        """Get category names (served from the prefetch cache when set up)"""
         return [cat.name for cat in obj.categories.all()]
 
 
@@ -120,7 +162,12 @@ class PostSerializer(serializers.ModelSerializer):
 
     category_name = serializers.CharField(source="category.name", read_only=True)
     category_slug = serializers.CharField(source="category.slug", read_only=True)
-    absolute_url = serializers.SerializerMethodField()
+    absolute_url = serializers.ReadOnlyField(source="get_absolute_url")
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the category this serializer reads name/slug from"""
+        return queryset.select_related("category")
 
     class Meta:
         model = AffiliatePost
@@ -140,9 +187,19 @@ class PostSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
-    def get_absolute_url(self, obj):
-        """Get absolute URL"""
-        return obj.get_absolute_url()
+
+class PostListSerializer(PostSerializer):
+    """
+    Lightweight PostSerializer for list endpoints.
+
+    Drops the content HTML body - it can dwarf every other field
+    combined and list consumers only render the excerpt. Pair with a
+    queryset that defers the column so it never leaves the database.
+    """
+
+    class Meta(PostSerializer.Meta):
+        fields = [f for f in PostSerializer.Meta.fields if f != "content"]
+        read_only_fields = fields
 
 
 # ============================================================================
@@ -255,6 +312,7 @@ __all__ = [
     "CategorySerializer",
     "ProductSerializer",
     "PostSerializer",
+    "PostListSerializer",
     # Forms
     "CategoryFilterForm",
     "PostFilterForm",
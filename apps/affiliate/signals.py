@@ -0,0 +1,85 @@
+"""
+Affiliate App Signals
+=====================
+Event-driven cache invalidation.
+
+TTL-only freshness means a product that goes out of stock keeps being
+served until the next scheduled refresh. These receivers invalidate the
+cached product lists of every affected category the moment a product
+changes; the TTL remains as a safety net.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.affiliate.models import (
+    AffiliateCategory,
+    AffiliateProduct,
+    AffiliateProductCache,
+)
+
+
+def _invalidate_product_caches(product):
+    """Invalidate DB, Redis, and in-process caches for a product's categories."""
+    category_ids = list(product.categories.values_list("id", flat=True))
+    if not category_ids:
+        return
+
+    # Mark the DB-side caches stale with a single UPDATE
+    AffiliateProductCache.objects.filter(category_id__in=category_ids).update(
+        is_fresh=False
+    )
+
+    # Drop the shared product-list entries (delete_pattern is django-redis
+    # only; on other backends the versioned keys age out via TTL)
+    if hasattr(cache, "delete_pattern"):
+        for category_id in category_ids:
+            cache.delete_pattern(f"cat_products:{category_id}:*")
+
+    # Drop matching in-process L1 entries too
+    from apps.affiliate import affiliate_services
+
+    prefixes = tuple(f"cat_products:{category_id}:" for category_id in category_ids)
+    for key in list(affiliate_services._product_list_l1):
+        if key.startswith(prefixes):
+            affiliate_services._product_list_l1.pop(key, None)
+
+
+@receiver(post_save, sender=AffiliateProduct)
+def invalidate_on_product_save(sender, instance, **kwargs):
+    """Invalidate category product caches when a product changes"""
+    _invalidate_product_caches(instance)
+
+
+@receiver(post_delete, sender=AffiliateProduct)
+def invalidate_on_product_delete(sender, instance, **kwargs):
+    """Invalidate category product caches when a product is removed"""
+    _invalidate_product_caches(instance)
+
+
+@receiver(post_save, sender=AffiliateProductCache)
+def invalidate_product_block_on_cache_save(sender, instance, **kwargs):
+    """Drop the cached product-block fragment when a category's cache refreshes.
+
+    product_block_view stores the rendered fragment under an explicit
+    per-slug key, so one targeted delete works on every backend. The
+    slug is fetched as a single column rather than loading the whole
+    category row on each cache save.
+    """
+    from apps.affiliate.views import product_block_cache_key
+
+    slug = (
+        AffiliateCategory.objects.filter(pk=instance.category_id)
+        .values_list("slug", flat=True)
+        .first()
+    )
+    if slug:
+        cache.delete(product_block_cache_key(slug))
+
+
+__all__ = [
+    "invalidate_on_product_save",
+    "invalidate_on_product_delete",
+    "invalidate_product_block_on_cache_save",
+]
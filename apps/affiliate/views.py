@@ -13,9 +13,11 @@ Views:
 
 from django.views.generic import ListView, DetailView
 from django.shortcuts import render, get_object_or_404
-from django.db.models import Q, Count
+from django.db import connection
+from django.db.models import CharField, Count, FloatField, Q, Value
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.http import JsonResponse
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.cache import cache_page
 from django.utils.decorators import method_decorator
 
@@ -44,7 +46,8 @@ class CategoryListView(ListView):
             AffiliateCategory.objects.filter(
                 status="ACTIVE", parent__isnull=True
             )  # Parent categories only
-            .annotate(post_count=Count("posts"))
+            .select_related("affiliate_product_cache")
+            .annotate(post_count=Count("posts", filter=Q(posts__status="PUBLISHED")))
             .order_by("-is_featured", "display_order")
         )
 
@@ -54,7 +57,11 @@ class CategoryListView(ListView):
         context["featured_categories"] = AffiliateCategory.objects.filter(
             status="ACTIVE", is_featured=True, parent__isnull=True
         ).order_by("display_order")[:3]
-        context["total_categories"] = self.get_queryset().count()
+        # Count on the unannotated queryset - .count() on the annotated one
+        # re-runs the whole GROUP BY query just for a number
+        context["total_categories"] = AffiliateCategory.objects.filter(
+            status="ACTIVE", parent__isnull=True
+        ).count()
         return context
 
 
@@ -79,8 +86,12 @@ class CategoryDetailView(DetailView):
     slug_url_kwarg = "slug"
 
     def get_queryset(self):
-        """Only show active categories"""
-        return AffiliateCategory.objects.filter(status="ACTIVE")
+        """Only show active categories (with cache/filter rows eager-loaded)"""
+        return AffiliateCategory.objects.filter(status="ACTIVE").select_related(
+            "affiliate_product_cache",
+            "parent__affiliate_product_cache",
+            "filter_rules",
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -89,17 +100,18 @@ class CategoryDetailView(DetailView):
         # Get subcategories
         context["subcategories"] = (
             category.get_children()
-            .annotate(post_count=Count("posts"))
+            .annotate(post_count=Count("posts", filter=Q(posts__status="PUBLISHED")))
             .order_by("display_order")
         )
 
         # Get products from cache (CORE FEATURE - no API calls!)
-        try:
-            cache = category.affiliate_product_cache
+        # getattr instead of try/except - no exception on the miss path
+        cache = getattr(category, "affiliate_product_cache", None)
+        if cache is not None:
             context["products"] = cache.get_products()[:8]  # Top 8 products
-            context["products_available"] = len(cache.cached_asins) > 0
+            context["products_available"] = bool(cache.cached_asins)
             context["product_count"] = cache.product_count
-        except:
+        else:
             context["products"] = []
             context["products_available"] = False
             context["product_count"] = 0
@@ -143,7 +155,10 @@ class BlogListView(ListView):
         """Get published posts"""
         queryset = (
             AffiliatePost.objects.filter(status="PUBLISHED")
-            .select_related("category")
+            .select_related("category", "category__affiliate_product_cache")
+            # The list template renders title/excerpt, never the post
+            # body - don't ship the big content column for every card
+            .defer("content")
             .order_by("-published_at")
         )
 
@@ -157,9 +172,16 @@ class BlogListView(ListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
+        # Batch-load featured products for the page of posts (one query
+        # instead of one per post)
+        from apps.affiliate.affiliate_services import ProductService
+
+        context["posts"] = ProductService.attach_featured_products(context["posts"])
+
         # Featured post (most recent)
         context["featured_post"] = (
             AffiliatePost.objects.filter(status="PUBLISHED")
+            .defer("content")
             .order_by("-published_at")
             .first()
         )
@@ -167,7 +189,7 @@ class BlogListView(ListView):
         # Categories for filter sidebar
         context["categories"] = (
             AffiliateCategory.objects.filter(status="ACTIVE", parent__isnull=True)
-            .annotate(post_count=Count("posts"))
+            .annotate(post_count=Count("posts", filter=Q(posts__status="PUBLISHED")))
             .filter(post_count__gt=0)
         )
 
@@ -178,7 +200,7 @@ class BlogListView(ListView):
                 context["active_category"] = AffiliateCategory.objects.get(
                     slug=category_slug
                 )
-            except:
+            except AffiliateCategory.DoesNotExist:
                 context["active_category"] = None
 
         return context
@@ -212,16 +234,15 @@ class BlogDetailView(DetailView):
         context = super().get_context_data(**kwargs)
         post = self.object
 
-        # Increment view count
-        post.view_count += 1
-        post.save(update_fields=["view_count"])
+        # Buffer the view in the cache and let the beat task fold it
+        # into view_count - no synchronous DB write on the read path
+        from apps.affiliate.affiliate_services import record_post_view
+
+        record_post_view(post.pk)
 
         # Get featured products from category
-        try:
-            cache = post.category.affiliate_product_cache
-            context["products"] = cache.get_products()[:4]
-        except:
-            context["products"] = []
+        cache = getattr(post.category, "affiliate_product_cache", None)
+        context["products"] = cache.get_products()[:4] if cache is not None else []
 
         # Get related posts (same category, excluding this one)
         context["related_posts"] = (
@@ -244,6 +265,16 @@ class BlogDetailView(DetailView):
         return context
 
 
+# Rendered product-block fragments live this long unless a cache
+# refresh drops them early via signals
+PRODUCT_BLOCK_TTL = 60 * 15
+
+
+def product_block_cache_key(category_slug):
+    """Cache key for a rendered product-block fragment"""
+    return f"pblock:{category_slug}"
+
+
 def product_block_view(request, category_slug):
     """
     Reusable product block component (AJAX).
@@ -251,38 +282,55 @@ def product_block_view(request, category_slug):
     Returns HTML fragment showing products for a category.
     Useful for embedding product blocks in multiple places.
 
+    The rendered fragment is cached for 15 minutes under an explicit
+    per-slug key (cache_page hashes the URL into its keys, which left
+    the signal invalidation unable to target one slug); a cache refresh
+    invalidates it early via signals.
+
     Usage:
         {% include 'components/product_block.html' with category=category %}
 
     Or via AJAX:
         GET /affiliate/api/product-block/<category_slug>/
     """
+    cache_key = product_block_cache_key(category_slug)
+    html = cache.get(cache_key)
+    if html is not None:
+        return HttpResponse(html)
 
     try:
-        category = AffiliateCategory.objects.get(slug=category_slug, status="ACTIVE")
+        category = AffiliateCategory.objects.select_related(
+            "affiliate_product_cache"
+        ).get(slug=category_slug, status="ACTIVE")
 
         # Get products from cache
-        try:
-            cache = category.affiliate_product_cache
-            products = cache.get_products()[:4]
-        except:
-            products = []
+        product_cache = getattr(category, "affiliate_product_cache", None)
+        products = (
+            product_cache.get_products()[:4] if product_cache is not None else []
+        )
 
         context = {
             "category": category,
             "products": products,
         }
 
-        return render(request, "components/product_block.html", context)
+        response = render(request, "components/product_block.html", context)
+        cache.set(cache_key, response.content, PRODUCT_BLOCK_TTL)
+        return response
 
     except AffiliateCategory.DoesNotExist:
         return JsonResponse({"error": "Category not found"}, status=404)
 
 
+@cache_page(60 * 5, key_prefix="affiliate_search")
 def search_view(request):
     """
     Search across categories and blog posts.
 
+    Results are cached for 5 minutes per full URL (query, type, and page
+    all live in the querystring), so repeated searches skip the DB and
+    the Python-side result assembly entirely.
+
     Query Parameters:
     - q: Search query
     - type: 'all', 'categories', 'posts' (default: all)
@@ -294,54 +342,129 @@ def search_view(request):
     query = request.GET.get("q", "").strip()
     search_type = request.GET.get("type", "all")
 
-    categories = []
-    posts = []
+    # Both sides are shaped into the same (id, name, slug, description,
+    # kind, similarity) columns so they can be combined with UNION ALL -
+    # one round-trip for counting and one for the page slice, with the
+    # LIMIT applied below the union by the database
+    search_columns = ("id", "name", "slug", "description", "kind", "similarity")
+    sides = []
 
     if query:
+        # On PostgreSQL, match via pg_trgm similarity on the short text
+        # columns (GIN-indexed) instead of unindexable ILIKE '%...%' scans
+        use_trigram = connection.vendor == "postgresql"
+        if use_trigram:
+            from django.contrib.postgres.search import TrigramSimilarity
+            from django.db.models.functions import Greatest
+
         # Search categories
         if search_type in ["all", "categories"]:
-            categories = AffiliateCategory.objects.filter(
-                Q(name__icontains=query) | Q(description__icontains=query),
-                status="ACTIVE",
-            ).order_by("name")
+            if use_trigram:
+                categories = AffiliateCategory.objects.annotate(
+                    similarity=Greatest(
+                        TrigramSimilarity("name", query),
+                        TrigramSimilarity("description", query),
+                    )
+                ).filter(similarity__gt=0.1, status="ACTIVE")
+            else:
+                categories = AffiliateCategory.objects.filter(
+                    Q(name__icontains=query) | Q(description__icontains=query),
+                    status="ACTIVE",
+                ).annotate(similarity=Value(0.0, output_field=FloatField()))
+
+            sides.append(
+                categories.annotate(
+                    kind=Value("category", output_field=CharField())
+                )
+                # Clear Meta.ordering - compound subqueries can't carry it
+                .order_by()
+                .values(*search_columns)
+            )
 
         # Search posts
         if search_type in ["all", "posts"]:
-            posts = (
-                AffiliatePost.objects.filter(
+            if use_trigram:
+                posts = AffiliatePost.objects.annotate(
+                    similarity=Greatest(
+                        TrigramSimilarity("title", query),
+                        TrigramSimilarity("excerpt", query),
+                    )
+                ).filter(similarity__gt=0.1, status="PUBLISHED")
+            else:
+                posts = AffiliatePost.objects.filter(
                     Q(title__icontains=query)
                     | Q(content__icontains=query)
                     | Q(excerpt__icontains=query),
                     status="PUBLISHED",
-                )
-                .select_related("category")
-                .order_by("-published_at")
+                ).annotate(similarity=Value(0.0, output_field=FloatField()))
+
+            sides.append(
+                posts.annotate(kind=Value("post", output_field=CharField()))
+                .order_by()
+                .values("id", "title", "slug", "excerpt", "kind", "similarity")
             )
 
-    # Pagination
+    if len(sides) == 2:
+        results = sides[0].union(sides[1], all=True)
+    elif sides:
+        results = sides[0]
+    else:
+        results = None
+
+    # Best trigram match first on Postgres; grouped categories-then-posts
+    # alphabetically on the fallback path (single-side queries sort on
+    # their own first text column, which the union aliases as "name")
+    if results is not None:
+        if connection.vendor == "postgresql":
+            results = results.order_by("-similarity")
+        elif len(sides) == 2 or search_type == "categories":
+            results = results.order_by("kind", "name")
+        else:
+            results = results.order_by("title")
+
+    # Pagination pushed into SQL: one COUNT over the union, then a single
+    # LIMIT/OFFSET slice, so memory stays O(page_size)
     page_number = request.GET.get("page", 1)
+    per_page = 12
 
-    # Combine and paginate all results
-    all_results = list(categories) + list(posts)
-    paginator = Paginator(all_results, 12)  # 12 results per page
+    total_results = results.count() if results is not None else 0
+    paginator = Paginator(range(total_results), per_page)  # page math only
 
     try:
         page_obj = paginator.page(page_number)
     except (PageNotAnInteger, EmptyPage):
         page_obj = paginator.page(1)
 
+    start = page_obj.start_index() - 1 if total_results else 0
+    end = page_obj.end_index()
+
+    page_results = list(results[start:end]) if results is not None else []
+    for row in page_results:
+        # Posts-only queries skip the union, so their rows still carry
+        # title/excerpt keys - normalise to the union's column names
+        if "title" in row:
+            row["name"] = row.pop("title")
+            row["description"] = row.pop("excerpt")
+        if row["kind"] == "category":
+            row["url"] = f"/affiliate/{row['slug']}/"
+        else:
+            row["url"] = f"/blog/{row['slug']}/"
+
+    page_obj.object_list = page_results
+
     context = {
         "query": query,
         "search_type": search_type,
         "page_obj": page_obj,
-        "categories": categories,
-        "posts": posts,
-        "total_results": paginator.count,
+        "categories": [r for r in page_results if r["kind"] == "category"],
+        "posts": [r for r in page_results if r["kind"] == "post"],
+        "total_results": total_results,
     }
 
     return render(request, "affiliate/search_results.html", context)
 
 
+@cache_page(60 * 10)
 def homepage_view(request):
     """
     Homepage - show featured categories and posts.
@@ -350,22 +473,31 @@ def homepage_view(request):
     - Featured categories (up to 6)
     - Recent blog posts (up to 6)
     - Total stats
+
+    Mostly static content, so the whole response is cached for 10
+    minutes and the two stat counts share one aggregate round-trip.
     """
 
+    totals = AffiliateCategory.objects.aggregate(
+        total_categories=Count(
+            "id", filter=Q(status="ACTIVE", parent__isnull=True)
+        )
+    )
+
     context = {
         "featured_categories": (
             AffiliateCategory.objects.filter(
                 status="ACTIVE", is_featured=True, parent__isnull=True
-            ).order_by("display_order")[:6]
+            )
+            .select_related("affiliate_product_cache")
+            .order_by("display_order")[:6]
         ),
         "recent_posts": (
-            AffiliatePost.objects.filter(status="PUBLISHED").order_by("-published_at")[
-                :6
-            ]
+            AffiliatePost.objects.filter(status="PUBLISHED")
+            .defer("content")
+            .order_by("-published_at")[:6]
         ),
-        "total_categories": AffiliateCategory.objects.filter(
-            status="ACTIVE", parent__isnull=True
-        ).count(),
+        "total_categories": totals["total_categories"],
         "total_posts": AffiliatePost.objects.filter(status="PUBLISHED").count(),
     }
 
@@ -375,9 +507,16 @@ def homepage_view(request):
 # API Views (for future mobile app or AJAX)
 
 from rest_framework import viewsets, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from apps.affiliate.serializers import CategorySerializer, PostSerializer
+from apps.affiliate.serializers import (
+    CategorySerializer,
+    PostSerializer,
+    PostListSerializer,
+    ProductSerializer,
+)
 
 class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -393,39 +532,113 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = CategorySerializer
     lookup_field = "slug"
 
+    def get_queryset(self):
+        """Apply the eager loading the serializer declares for itself"""
+        return self.get_serializer_class().setup_eager_loading(super().get_queryset())
+
+    def get_serializer_context(self):
+        """
+        Pre-walk the active category tree once and hand the serializer
+        a children map + post counts, so recursive get_children and the
+        per-node count methods never touch the database (2 queries total
+        instead of O(nodes)).
+        """
+        context = super().get_serializer_context()
+
+        children_by_parent = AffiliateCategory.build_children_map()
+
+        post_counts = dict(
+            AffiliatePost.objects.filter(status="PUBLISHED")
+            .values_list("category_id")
+            .annotate(c=Count("id"))
+        )
+
+        context["children_by_parent"] = children_by_parent
+        context["post_counts"] = post_counts
+        return context
+
     @action(detail=True, methods=["get"])
     def products(self, request, slug=None):
         """Get products for a category"""
         category = self.get_object()
 
-        try:
-            cache = category.affiliate_product_cache
-            products = cache.get_products()
-        except:
+        cache = getattr(category, "affiliate_product_cache", None)
+        if cache is not None:
+            products = ProductSerializer(
+                ProductSerializer.setup_eager_loading(cache.get_products()),
+                many=True,
+            ).data
+        else:
             products = []
 
         return Response(
             {
-                "category": self.serializer_class(category).data,
+                "category": self.get_serializer(category).data,
                 "products": products,
                 "count": len(products),
             }
         )
 
 
+class PostCursorPagination(CursorPagination):
+    """
+    Cursor pagination over published_at.
+
+    Unlike page-number pagination, deep pages stay O(page_size) - the
+    cursor turns into an indexed range scan on post_published_idx
+    instead of an OFFSET that reads and discards earlier rows.
+    """
+
+    page_size = 20
+    ordering = "-published_at"
+
+
 class BlogViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for blog posts.
 
     Endpoints:
-    - GET /api/posts/ → List all
+    - GET /api/posts/ → List all (cursor-paginated)
     - GET /api/posts/<id>/ → Detail
+
+    Query Parameters (list):
+    - category: Category id
+    - author: Author name
     """
 
     queryset = AffiliatePost.objects.filter(status="PUBLISHED")
     serializer_class = PostSerializer
+    pagination_class = PostCursorPagination
     lookup_field = "slug"
-    filterset_fields = ["category", "author"]
+
+    def get_serializer_class(self):
+        """Use the content-free serializer for list responses"""
+        if self.action == "list":
+            return PostListSerializer
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        """Defer the content body on list and apply querystring filters"""
+        queryset = self.get_serializer_class().setup_eager_loading(
+            super().get_queryset()
+        )
+        if self.action == "list":
+            queryset = queryset.defer("content")
+
+            category = self.request.query_params.get("category")
+            if category:
+                # Validate before filtering: a non-numeric id would
+                # raise at queryset evaluation and surface as a 500
+                try:
+                    category_id = int(category)
+                except ValueError:
+                    raise ValidationError({"category": "Must be an integer id."})
+                queryset = queryset.filter(category_id=category_id)
+
+            author = self.request.query_params.get("author")
+            if author:
+                queryset = queryset.filter(author=author)
+        return queryset
 
 
 __all__ = [
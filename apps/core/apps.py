@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.core"
+
+    def ready(self):
+        # Start the thread that drains the logging queue into the
+        # rotating files (see config.logconf)
+        from config import logconf
+
+        logconf.start_listener()
@@ -140,18 +140,34 @@ class ServiceCity(TimeStampedModel):
     def __str__(self):
         return f"{self.service_name} in {self.city_name}"
 
+    # Fields whose writes can require slug generation
+    _SLUG_FIELDS = frozenset(
+        ["service_name", "city_name", "service_slug", "city_slug", "page_slug"]
+    )
+
     def save(self, *args, **kwargs):
+        # Narrow update_fields saves (e.g. counter/status bumps) skip the
+        # slugify and publish bookkeeping entirely
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = set(update_fields)
+
         # Auto-generate slugs if not provided
-        if not self.service_slug:
-            self.service_slug = slugify(self.service_name)
-        if not self.city_slug:
-            self.city_slug = slugify(self.city_name)
-        if not self.page_slug:
-            self.page_slug = f"{self.service_slug}-{self.city_slug}"
+        if update_fields is None or update_fields & self._SLUG_FIELDS:
+            if not self.service_slug:
+                self.service_slug = slugify(self.service_name)
+            if not self.city_slug:
+                self.city_slug = slugify(self.city_name)
+            if not self.page_slug:
+                self.page_slug = f"{self.service_slug}-{self.city_slug}"
 
         # Set published_at when status changes to ACTIVE
-        if self.status == "ACTIVE" and not self.published_at:
-            self.published_at = timezone.now()
+        if update_fields is None or "status" in update_fields:
+            if self.status == "ACTIVE" and not self.published_at:
+                self.published_at = timezone.now()
+                if update_fields is not None:
+                    update_fields.add("published_at")
+                    kwargs["update_fields"] = update_fields
 
         super().save(*args, **kwargs)
 
@@ -240,17 +256,34 @@ class Setting(models.Model):
         verbose_name = "Setting"
         verbose_name_plural = "Settings"
 
+    # In-process cache: settings change rarely but are read in hot paths,
+    # so repeat lookups should be a dict hit, not a DB round-trip
+    _cache = {}
+
     def __str__(self):
         return f"{self.key} = {self.value}"
 
     @classmethod
     def get(cls, key, default=None):
-        """Get a setting value by key"""
+        """Get a setting value by key (cached after the first lookup)"""
+        if key in cls._cache:
+            return cls._cache[key]
         try:
-            setting = cls.objects.get(key=key)
-            return setting.value
+            # values_list skips building a full model instance per miss
+            value = cls.objects.values_list("value", flat=True).get(key=key)
         except cls.DoesNotExist:
             return default
+        cls._cache[key] = value
+        return value
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        type(self)._cache.clear()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        type(self)._cache.clear()
+        return result
 
 
 class TaskLog(TimeStampedModel):
@@ -12,12 +12,59 @@ Key:
 import requests
 import os
 from decimal import Decimal
+from functools import lru_cache
 from typing import List, Dict, Optional
 import logging
 
+from django.utils.text import slugify
+
 logger = logging.getLogger(__name__)
 
 
+# Field paths into the PA-API response, declared once. Walking these
+# beats chained .get(x, {}).get(y) - no throwaway {} per missing level
+_PRODUCT_PATHS = {
+    "title": ("ItemInfo", "Title", "DisplayValue"),
+    "price": ("Offers", "Listings", 0, "Price", "Amount"),
+    "rating": ("CustomerReviews", "StarRating"),
+    "review_count": ("CustomerReviews", "Count"),
+    "image_url": ("Images", "Primary", "Large", "URL"),
+}
+
+
+def _extract(data, path):
+    """Walk a precompiled key/index path, returning None on any miss"""
+    for step in path:
+        if isinstance(step, int):
+            if not isinstance(data, (list, tuple)) or len(data) <= step:
+                return None
+            data = data[step]
+        elif isinstance(data, dict):
+            data = data.get(step)
+        else:
+            return None
+        if data is None:
+            return None
+    return data
+
+
+@lru_cache(maxsize=1)
+def _amazon_config() -> Dict:
+    """
+    Env-derived Amazon constants, read once per process.
+
+    Hot paths (URL building, response parsing) run thousands of times
+    per refresh; the lru_cache keeps them off os.environ while still
+    letting tests reset via _amazon_config.cache_clear().
+    """
+    region = os.getenv("AMAZON_REGION", "co.uk")
+    return {
+        "region": region,
+        "partner_tag": os.getenv("AMAZON_PARTNER_TAG", ""),
+        "url_prefix": f"https://amazon.{region}/dp/",
+    }
+
+
 class AmazonAPIClient:
     """
     Client for Amazon Product Advertising API.
@@ -28,8 +75,26 @@ class AmazonAPIClient:
     - Rate limiting
 
     For now, this demonstrates the interface.
+
+    All HTTP goes through a shared pooled Session (one per process), so
+    concurrent category refreshes reuse TCP/TLS connections instead of
+    paying a handshake per call, and transient 5xx/429 responses retry
+    with backoff.
     """
 
+    # Shared across instances - clients are created per task invocation
+    # but the underlying connection pool should persist
+    _session = None
+
+    # (connect, read) timeouts so a stuck call can't hang a refresh run
+    REQUEST_TIMEOUT = (3, 10)
+
+    # Read-through cache TTLs per endpoint - category lists move slowly,
+    # searches go stale faster, single products sit in between
+    CATEGORY_TTL = 86400  # 24 hours
+    SEARCH_TTL = 7200  # 2 hours
+    PRODUCT_TTL = 21600  # 6 hours
+
     def __init__(self, region="co.uk"):
         """
         Initialize Amazon API client.
@@ -42,6 +107,41 @@ class AmazonAPIClient:
         self.secret_key = os.getenv("AMAZON_SECRET_KEY", "")
         self.partner_tag = os.getenv("AMAZON_PARTNER_TAG", "")
         self.base_url = f"https://api.amazon.{region}"
+        self.session = self._get_session()
+
+    @classmethod
+    def _get_session(cls):
+        """Build (once) and return the shared pooled session"""
+        if cls._session is None:
+            from requests.adapters import HTTPAdapter, Retry
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            cls._session = session
+        return cls._session
+
+    def _cache_key(self, endpoint: str, identifier: str) -> str:
+        """Domain-scoped cache key: amazon:<region>:<endpoint>:<id>"""
+        return f"amazon:{self.region}:{endpoint}:{identifier}"
+
+    @staticmethod
+    def _fingerprint(payload: Dict) -> str:
+        """Stable short digest for dict parameters (hash() varies per process)"""
+        import hashlib
+        import json
+
+        serialized = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.md5(serialized.encode()).hexdigest()[:12]
 
     def search_products(
         self, keywords: str, category_id: Optional[str] = None, max_results: int = 10
@@ -61,21 +161,32 @@ class AmazonAPIClient:
             In production, this would call Amazon's API.
             For Phase 1, this is a placeholder.
         """
-        try:
-            # In real implementation:
-            # 1. Sign request with AWS credentials
-            # 2. Call Amazon PA API
-            # 3. Parse response
-            # 4. Return product data
+        key = self._cache_key(
+            "search",
+            self._fingerprint(
+                {"q": keywords, "category": category_id, "max": max_results}
+            ),
+        )
 
-            logger.info(f"Amazon API: Searching for '{keywords}'")
+        def fetch():
+            try:
+                # In real implementation:
+                # 1. Sign request with AWS credentials
+                # 2. Call Amazon PA API via
+                #    self.session.get(..., timeout=self.REQUEST_TIMEOUT)
+                # 3. Parse response
+                # 4. Return product data
 
-            # Placeholder: return empty for now
-            return []
+                logger.info("Amazon API: Searching for '%s'", keywords)
 
-        except Exception as e:
-            logger.error(f"Amazon API error: {e}")
-            return []
+                # Placeholder: return empty for now
+                return []
+
+            except Exception:
+                logger.exception("Amazon API error")
+                return []
+
+        return CacheHelper.get_or_compute(key, fetch, self.SEARCH_TTL)
 
     def get_product_details(self, asin: str) -> Optional[Dict]:
         """
@@ -87,19 +198,24 @@ class AmazonAPIClient:
         Returns:
             Product data dict or None
         """
-        try:
-            logger.info(f"Amazon API: Getting details for ASIN {asin}")
+        key = self._cache_key("product", asin)
 
-            # In real implementation:
-            # 1. Call Amazon API for single product
-            # 2. Parse response
-            # 3. Return data
+        def fetch():
+            try:
+                logger.info("Amazon API: Getting details for ASIN %s", asin)
 
-            return None
+                # In real implementation:
+                # 1. Call Amazon API for single product
+                # 2. Parse response
+                # 3. Return data
 
-        except Exception as e:
-            logger.error(f"Amazon API error: {e}")
-            return None
+                return None
+
+            except Exception:
+                logger.exception("Amazon API error")
+                return None
+
+        return CacheHelper.get_or_compute(key, fetch, self.PRODUCT_TTL)
 
     def get_category_products(self, category_node: str, filters: Dict) -> List[Dict]:
         """
@@ -112,20 +228,27 @@ class AmazonAPIClient:
         Returns:
             List of filtered products
         """
-        try:
-            logger.info(f"Amazon API: Getting category {category_node} products")
+        key = self._cache_key(
+            "category", f"{category_node}:{self._fingerprint(filters)}"
+        )
+
+        def fetch():
+            try:
+                logger.info("Amazon API: Getting category %s products", category_node)
+
+                # In real implementation:
+                # 1. Query Amazon API for category
+                # 2. Filter results by rules
+                # 3. Rank by BSR/rating
+                # 4. Return top results
 
-            # In real implementation:
-            # 1. Query Amazon API for category
-            # 2. Filter results by rules
-            # 3. Rank by BSR/rating
-            # 4. Return top results
+                return []
 
-            return []
+            except Exception:
+                logger.exception("Amazon API error")
+                return []
 
-        except Exception as e:
-            logger.error(f"Amazon API error: {e}")
-            return []
+        return CacheHelper.get_or_compute(key, fetch, self.CATEGORY_TTL)
 
     @staticmethod
     def parse_product_data(raw_data: Dict) -> Optional[Dict]:
@@ -142,36 +265,27 @@ class AmazonAPIClient:
             if not raw_data:
                 return None
 
+            asin = raw_data.get("ASIN")
+            price = _extract(raw_data, _PRODUCT_PATHS["price"])
+
             product = {
-                "asin": raw_data.get("ASIN"),
-                "title": raw_data.get("ItemInfo", {})
-                .get("Title", {})
-                .get("DisplayValue"),
-                "url": f"https://amazon.{os.getenv('AMAZON_REGION', 'co.uk')}/dp/{raw_data.get('ASIN')}",
-                "price": Decimal(
-                    str(
-                        raw_data.get("Offers", {})
-                        .get("Listings", [{}])[0]
-                        .get("Price", {})
-                        .get("Amount", 0)
-                    )
-                ),
+                "asin": asin,
+                "title": _extract(raw_data, _PRODUCT_PATHS["title"]),
+                "url": _amazon_config()["url_prefix"] + (asin or ""),
+                "price": Decimal(str(price if price is not None else 0)),
                 "rating": float(
-                    raw_data.get("CustomerReviews", {}).get("StarRating", 0)
+                    _extract(raw_data, _PRODUCT_PATHS["rating"]) or 0
                 ),
                 "review_count": int(
-                    raw_data.get("CustomerReviews", {}).get("Count", 0)
+                    _extract(raw_data, _PRODUCT_PATHS["review_count"]) or 0
                 ),
-                "image_url": raw_data.get("Images", {})
-                .get("Primary", {})
-                .get("Large", {})
-                .get("URL"),
+                "image_url": _extract(raw_data, _PRODUCT_PATHS["image_url"]),
             }
 
             return product
 
-        except Exception as e:
-            logger.error(f"Parse error: {e}")
+        except Exception:
+            logger.exception("Parse error")
             return None
 
 
@@ -204,16 +318,24 @@ class ProductRanker:
                 "bsr": 0.3,
             }
 
-        # Sort by rating first, then reviews, then BSR
-        return sorted(
-            products,
-            key=lambda p: (
-                -(p.get("rating", 0) * weights["rating"]),
-                -(p.get("review_count", 0) * weights["reviews"]),
-                (p.get("bsr_rank", float("inf")) * weights["bsr"]),
-            ),
+        # One weighted scalar per product, computed once, compared as a
+        # plain float. The old tuple key compared factors lexicographically,
+        # so the weights never actually blended anything - rating alone
+        # decided almost every comparison
+        missing_bsr = (
+            max((p.get("bsr_rank") or 0 for p in products), default=0) + 1
         )
 
+        def score(product):
+            bsr = product.get("bsr_rank") or missing_bsr
+            return (
+                weights["rating"] * product.get("rating", 0)
+                + weights["reviews"] * product.get("review_count", 0)
+                - weights["bsr"] * bsr
+            )
+
+        return sorted(products, key=score, reverse=True)
+
 
 class CacheHelper:
     """
@@ -249,6 +371,33 @@ class CacheHelper:
         except:
             return default
 
+    @staticmethod
+    def get_or_compute(key: str, factory, timeout: int = CACHE_TIMEOUT):
+        """
+        Read-through cache: return the cached value or compute and store it.
+
+        Only truthy results are stored, so empty placeholder responses
+        never pin a miss and get retried on the next read.
+
+        Args:
+            key: Cache key
+            factory: Zero-arg callable producing the value on a miss
+            timeout: Cache TTL in seconds
+
+        Returns:
+            Cached or freshly computed value
+        """
+        from django.core.cache import cache
+
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        value = factory()
+        if value:
+            cache.set(key, value, timeout)
+        return value
+
     @staticmethod
     def set_cache(key: str, value, timeout: int = CACHE_TIMEOUT):
         """
@@ -259,10 +408,38 @@ class CacheHelper:
 
             cache.set(key, value, timeout)
             return True
-        except Exception as e:
-            logger.error(f"Cache set error: {e}")
+        except Exception:
+            logger.exception("Cache set error")
             return False
 
+    @staticmethod
+    def get_many(keys):
+        """
+        Fetch several cache keys in one backend round-trip.
+
+        Args:
+            keys: Iterable of cache keys
+
+        Returns:
+            Dict of key -> value for the keys that were found
+        """
+        from django.core.cache import cache
+
+        return cache.get_many(keys)
+
+    @staticmethod
+    def set_many(mapping, timeout: int = CACHE_TIMEOUT):
+        """
+        Store several key/value pairs in one backend round-trip.
+
+        Args:
+            mapping: Dict of key -> value to cache
+            timeout: Cache TTL in seconds
+        """
+        from django.core.cache import cache
+
+        cache.set_many(mapping, timeout)
+
 
 class URLHelper:
     """
@@ -281,12 +458,12 @@ class URLHelper:
         Returns:
             Affiliate URL
         """
-        if not partner_tag:
-            partner_tag = os.getenv("AMAZON_PARTNER_TAG", "")
+        config = _amazon_config()
 
-        region = os.getenv("AMAZON_REGION", "co.uk")
+        if not partner_tag:
+            partner_tag = config["partner_tag"]
 
-        url = f"https://amazon.{region}/dp/{asin}"
+        url = config["url_prefix"] + asin
 
         if partner_tag:
             url += f"?tag={partner_tag}"
@@ -334,18 +511,37 @@ class TextHelper:
         Returns:
             Truncated text
         """
-        if len(text) > max_length:
-            return text[: max_length - len(suffix)] + suffix
-        return text
+        # Fast path first: most card excerpts already fit and should
+        # cost one len() and no allocation
+        if len(text) <= max_length:
+            return text
+        return text[: max_length - len(suffix)] + suffix
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def truncate_cached(text: str, max_length: int = 100, suffix: str = "...") -> str:
+        """
+        Memoized truncate for list views.
+
+        The same excerpts re-render on every page of a list view; the
+        cache turns repeat truncations into a dict hit.
+        """
+        return TextHelper.truncate(text, max_length, suffix)
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def slugify_custom(text: str) -> str:
         """
         Custom slug generation.
-        """
-        from django.utils.text import slugify
 
-        return slugify(text)
+        Memoized - the same titles and category names get slugified over
+        and over during post generation, and the regex-based slugify is
+        much pricier than a cache hit. Call
+        TextHelper.slugify_custom.cache_clear() if inputs churn heavily.
+        """
+        # str() guards against lazy translation proxies, which would
+        # defeat hashing-based memoization
+        return slugify(str(text))
 
 
 __all__ = [
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-31 13:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='leads_lead_status_e23abe_idx',
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('status', 'NEW')), fields=['-created_at'], name='lead_new_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('status__in', ['NEW', 'CONTACTED'])), fields=['created_at'], name='lead_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('is_billed', False), ('status', 'QUALIFIED')), fields=['provider_id'], name='lead_bill_idx'),
+        ),
+    ]
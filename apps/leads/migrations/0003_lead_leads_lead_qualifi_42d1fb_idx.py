@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 13:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0002_remove_lead_leads_lead_status_e23abe_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['qualified_at'], name='leads_lead_qualifi_42d1fb_idx'),
+        ),
+    ]
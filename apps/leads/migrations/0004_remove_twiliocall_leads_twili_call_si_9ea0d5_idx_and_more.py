@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-31 13:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0003_lead_leads_lead_qualifi_42d1fb_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='twiliocall',
+            name='leads_twili_call_si_9ea0d5_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='twiliomessage',
+            name='leads_twili_message_cab643_idx',
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['status', '-created_at'], name='leads_lead_status_7559b2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['provider_id', 'is_billed'], name='leads_lead_provide_e5bbb1_idx'),
+        ),
+    ]
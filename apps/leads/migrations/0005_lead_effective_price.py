@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-31 13:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0004_remove_twiliocall_leads_twili_call_si_9ea0d5_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lead',
+            name='effective_price',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Price resolved at qualification time (coverage override or provider base)', max_digits=10, null=True),
+        ),
+    ]
@@ -92,6 +92,13 @@ class Lead(models.Model):
         blank=True,
         help_text="Amount provider was charged (GBP)",
     )
+    effective_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        help_text="Price resolved at qualification time (coverage override or provider base)",
+    )
 
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
@@ -105,10 +112,33 @@ class Lead(models.Model):
         verbose_name = "Lead"
         verbose_name_plural = "Leads"
         indexes = [
-            models.Index(fields=["status"]),
             models.Index(fields=["provider_id", "status"]),
             models.Index(fields=["-created_at"]),
             models.Index(fields=["service", "city"]),
+            # Daily-report qualified count filters on this timestamp
+            models.Index(fields=["qualified_at"]),
+            # Stats breakdowns count per status within a date range
+            models.Index(fields=["status", "-created_at"]),
+            # Billing reports group billed/unbilled leads per provider
+            models.Index(fields=["provider_id", "is_billed"]),
+            # Partial indexes for the Celery hot paths: each task reads a
+            # tiny per-state index instead of the low-selectivity status
+            # column (most leads end up EXPIRED/CONVERTED over time)
+            models.Index(
+                fields=["-created_at"],
+                name="lead_new_idx",
+                condition=models.Q(status="NEW"),
+            ),
+            models.Index(
+                fields=["created_at"],
+                name="lead_active_idx",
+                condition=models.Q(status__in=["NEW", "CONTACTED"]),
+            ),
+            models.Index(
+                fields=["provider_id"],
+                name="lead_bill_idx",
+                condition=models.Q(status="QUALIFIED", is_billed=False),
+            ),
         ]
 
     def __str__(self):
@@ -258,7 +288,7 @@ class TwilioCall(models.Model):
         verbose_name = "Twilio Call"
         verbose_name_plural = "Twilio Calls"
         indexes = [
-            models.Index(fields=["call_sid"]),
+            # call_sid is unique=True, which already creates its B-tree
             models.Index(fields=["status"]),
             models.Index(fields=["lead", "-created_at"]),
         ]
@@ -341,7 +371,7 @@ class TwilioMessage(models.Model):
         verbose_name = "Twilio Message"
         verbose_name_plural = "Twilio Messages"
         indexes = [
-            models.Index(fields=["message_sid"]),
+            # message_sid is unique=True, which already creates its B-tree
             models.Index(fields=["status"]),
             models.Index(fields=["lead", "-created_at"]),
         ]
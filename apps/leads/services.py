@@ -10,10 +10,16 @@ Services:
 """
 
 from django.utils import timezone
-from django.db.models import Q, Count
+from django.db import transaction
+from django.db.models import F, Q, Count, Prefetch
 from decimal import Decimal
 import logging
 
+# Imported once at module load: these run on the per-lead/per-webhook
+# hot paths, and there is no circular dependency to work around
+from apps.leads.models import Lead, LeadEvent, TwilioCall, TwilioMessage
+from apps.providers.models import Provider, ProviderCoverage
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,8 +53,6 @@ class LeadService:
         Returns:
             Lead instance or error dict
         """
-        from apps.leads.models import Lead, LeadEvent
-
         try:
             # Create lead
             lead = Lead.objects.create(
@@ -58,7 +62,7 @@ class LeadService:
                 whatsapp=whatsapp or phone,
                 service=service,
                 city=city,
-                notes=notes,
+                notes=notes or "",
                 status="NEW",
             )
 
@@ -70,12 +74,12 @@ class LeadService:
                 triggered_by="SYSTEM",
             )
 
-            logger.info(f"Created lead: {lead.id} - {name}")
+            logger.info("Created lead: %s - %s", lead.id, name)
 
             return {"success": True, "lead": lead}
 
         except Exception as e:
-            logger.error(f"Error creating lead: {e}")
+            logger.error("Error creating lead: %s", e)
             return {"success": False, "error": str(e)}
 
     @staticmethod
@@ -89,31 +93,45 @@ class LeadService:
         Returns:
             Provider instance or None
         """
-        from apps.leads.models import LeadEvent
-
         # Find best provider
         provider = ProviderMatchingService.get_best_provider(
             service=lead.service, city=lead.city
         )
 
         if provider:
-            lead.provider_id = provider.id
-            lead.status = "CONTACTED"
-            lead.save()
+            # Lock the row so concurrent routing runs cannot assign the
+            # same lead twice; update + event commit as one transaction
+            with transaction.atomic():
+                locked = Lead.objects.select_for_update().get(pk=lead.pk)
+
+                if locked.provider_id:
+                    logger.info(
+                        "Lead %s already assigned to provider %s",
+                        lead.id,
+                        locked.provider_id,
+                    )
+                    return None
+
+                locked.provider_id = provider.id
+                locked.status = "CONTACTED"
+                locked.save(update_fields=["provider_id", "status", "updated_at"])
+
+                # Log assignment
+                LeadEvent.objects.create(
+                    lead=locked,
+                    event_type="ASSIGNED",
+                    description=f"Assigned to {provider.name}",
+                    triggered_by="SYSTEM",
+                )
 
-            # Log assignment
-            LeadEvent.objects.create(
-                lead=lead,
-                event_type="ASSIGNED",
-                description=f"Assigned to {provider.name}",
-                triggered_by="SYSTEM",
-            )
+            lead.provider_id = locked.provider_id
+            lead.status = locked.status
 
-            logger.info(f"Lead {lead.id} routed to provider {provider.id}")
+            logger.info("Lead %s routed to provider %s", lead.id, provider.id)
             return provider
 
         else:
-            logger.warning(f"No provider found for {lead.service} in {lead.city}")
+            logger.warning("No provider found for %s in %s", lead.service, lead.city)
             return None
 
     @staticmethod
@@ -122,27 +140,56 @@ class LeadService:
         Mark lead as qualified (ready to bill).
 
         Args:
-            lead: Lead instance
+            lead: Lead instance or lead ID
             triggered_by: Who triggered this ('SYSTEM', 'PROVIDER', 'ADMIN', 'TWILIO')
         """
-        from apps.leads.models import LeadEvent
+        lead_id = lead if isinstance(lead, int) else lead.pk
+        now = timezone.now()
 
-        if lead.status == "QUALIFIED":
-            return  # Already qualified
+        # Resolve the billable price once here so bill_lead never needs
+        # the extra coverage lookup
+        if isinstance(lead, int):
+            provider_id, service, city = (
+                Lead.objects.values_list("provider_id", "service", "city").get(
+                    pk=lead_id
+                )
+            )
+        else:
+            provider_id, service, city = lead.provider_id, lead.service, lead.city
+
+        price = BillingService.resolve_lead_price(provider_id, service, city)
+
+        # Conditional UPDATE: succeeds for exactly one caller even when
+        # the call and message webhooks qualify the same lead at once,
+        # without a SELECT or row lock
+        updated = (
+            Lead.objects.filter(pk=lead_id)
+            .exclude(status="QUALIFIED")
+            .update(
+                status="QUALIFIED",
+                qualified_at=now,
+                updated_at=now,
+                effective_price=price,
+            )
+        )
 
-        lead.status = "QUALIFIED"
-        lead.qualified_at = timezone.now()
-        lead.save()
+        if not updated:
+            return  # Already qualified
 
         # Log qualification
         LeadEvent.objects.create(
-            lead=lead,
+            lead_id=lead_id,
             event_type="QUALIFIED",
             description="Lead became qualified for billing",
             triggered_by=triggered_by,
         )
 
-        logger.info(f"Lead {lead.id} marked as QUALIFIED")
+        if not isinstance(lead, int):
+            lead.status = "QUALIFIED"
+            lead.qualified_at = now
+            lead.effective_price = price
+
+        logger.info("Lead %s marked as QUALIFIED", lead_id)
 
     @staticmethod
     def contact_provider_via_twilio(lead, provider):
@@ -156,50 +203,69 @@ class LeadService:
         Returns:
             dict with contact attempt result
         """
-        from apps.leads.models import LeadEvent
-
         # Determine contact method
         contact_method = provider.contact_method or "PHONE"
 
+        # Buffer events and flush once at the end: flows that produce
+        # several events pay one INSERT instead of one per event
+        events = []
+
         try:
             if contact_method in ["PHONE", "WHATSAPP"]:
                 # Make call
                 result = TwilioService.make_call(
                     to_number=provider.phone,
                     message=f"You have a new lead: {lead.name} - {lead.service} in {lead.city}",
+                    lead_id=lead.id,
                 )
             else:
                 # Send message
                 result = TwilioService.send_message(
                     to_number=provider.phone,
                     message=f"New lead: {lead.name} seeking {lead.service} in {lead.city}. Contact them at {lead.phone}",
+                    lead_id=lead.id,
                 )
 
             if result.get("success"):
                 # Log contact attempt
-                LeadEvent.objects.create(
-                    lead=lead,
-                    event_type="CONTACT_ATTEMPT",
-                    description=f"Attempted contact via {contact_method}",
-                    triggered_by="TWILIO",
+                events.append(
+                    LeadEvent(
+                        lead=lead,
+                        event_type="CONTACT_ATTEMPT",
+                        description=f"Attempted contact via {contact_method}",
+                        triggered_by="TWILIO",
+                    )
                 )
-
-                return result
             else:
                 # Log failure
-                LeadEvent.objects.create(
-                    lead=lead,
-                    event_type="CONTACT_FAILED",
-                    description=result.get("error", "Contact failed"),
-                    triggered_by="SYSTEM",
+                events.append(
+                    LeadEvent(
+                        lead=lead,
+                        event_type="CONTACT_FAILED",
+                        description=result.get("error", "Contact failed"),
+                        triggered_by="SYSTEM",
+                    )
                 )
 
-                return result
+            LeadService._flush_events(events)
+            return result
 
         except Exception as e:
-            logger.error(f"Error contacting provider: {e}")
+            logger.error("Error contacting provider: %s", e)
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def _flush_events(events):
+        """
+        Write a batch of unsaved LeadEvent instances in one INSERT.
+
+        Args:
+            events: List of unsaved LeadEvent instances
+        """
+
+        if events:
+            LeadEvent.objects.bulk_create(events)
+
     @staticmethod
     def get_lead_stats(time_period="today"):
         """
@@ -211,7 +277,6 @@ class LeadService:
         Returns:
             dict with statistics
         """
-        from apps.leads.models import Lead
         from datetime import timedelta
 
         now = timezone.now()
@@ -233,15 +298,16 @@ class LeadService:
             else Lead.objects.filter(created_at__gte=start_date)
         )
 
-        stats = {
-            "total": query.count(),
-            "new": query.filter(status="NEW").count(),
-            "contacted": query.filter(status="CONTACTED").count(),
-            "qualified": query.filter(status="QUALIFIED").count(),
-            "converted": query.filter(status="CONVERTED").count(),
-            "rejected": query.filter(status="REJECTED").count(),
-            "expired": query.filter(status="EXPIRED").count(),
-        }
+        # One conditional aggregate instead of seven COUNT round-trips
+        stats = query.aggregate(
+            total=Count("id"),
+            new=Count("id", filter=Q(status="NEW")),
+            contacted=Count("id", filter=Q(status="CONTACTED")),
+            qualified=Count("id", filter=Q(status="QUALIFIED")),
+            converted=Count("id", filter=Q(status="CONVERTED")),
+            rejected=Count("id", filter=Q(status="REJECTED")),
+            expired=Count("id", filter=Q(status="EXPIRED")),
+        )
 
         # Calculate conversion rate
         if stats["total"] > 0:
@@ -262,17 +328,39 @@ class LeadService:
         Returns:
             dict with lead and related info
         """
-        from apps.leads.models import Lead
-
         try:
-            lead = Lead.objects.get(id=lead_id)
+            # Prefetch all reverse relations in one batch so the template
+            # iterates cached lists instead of firing a query per relation
+            lead = (
+                Lead.objects.prefetch_related(
+                    Prefetch(
+                        "events", queryset=LeadEvent.objects.order_by("-created_at")
+                    ),
+                    Prefetch(
+                        "twilio_calls",
+                        queryset=TwilioCall.objects.order_by("-created_at"),
+                    ),
+                    Prefetch(
+                        "twilio_messages",
+                        queryset=TwilioMessage.objects.order_by("-created_at"),
+                    ),
+                ).get(id=lead_id)
+            )
+
+            # provider_id is a plain integer until the Phase 2 FK lands,
+            # so resolve the Provider row explicitly
+            provider = (
+                Provider.objects.filter(pk=lead.provider_id).first()
+                if lead.provider_id
+                else None
+            )
 
             return {
                 "lead": lead,
-                "provider": lead.provider_id if lead.provider_id else None,
-                "events": lead.events.all().order_by("-created_at"),
-                "calls": lead.twilio_calls.all().order_by("-created_at"),
-                "messages": lead.twilio_messages.all().order_by("-created_at"),
+                "provider": provider,
+                "events": lead.events.all(),
+                "calls": lead.twilio_calls.all(),
+                "messages": lead.twilio_messages.all(),
                 "time_to_qualified": (
                     (lead.qualified_at - lead.created_at) if lead.qualified_at else None
                 ),
@@ -291,6 +379,14 @@ class ProviderMatchingService:
     - Rating
     - Availability
     """
+    # Short TTL: hot (service, city) pairs skip the ranking query for a
+    # few seconds, while the leads-received tie-breaker still rotates
+    MATCH_CACHE_TTL = 30
+
+    @staticmethod
+    def match_cache_key(service, city):
+        """Cache key for the best-provider lookup of a service-city pair"""
+        return f"provider_match:{service}:{city}"
 
     @staticmethod
     def get_best_provider(service, city):
@@ -310,60 +406,96 @@ class ProviderMatchingService:
         Returns:
             Provider instance or None
         """
-        from apps.providers.models import Provider, ProviderCoverage
+        from django.core.cache import cache
+
+
+        cache_key = ProviderMatchingService.match_cache_key(service, city)
+
+        provider_id = cache.get(cache_key)
+        if provider_id is not None:
+            provider = Provider.objects.filter(pk=provider_id, status="ACTIVE").first()
+            if provider:
+                return provider
 
         try:
-            # Find providers covering this service-city
-            providers = Provider.objects.filter(status="ACTIVE")
-
-            # Filter by service coverage
-            providers_with_service = []
-            for provider in providers:
-                # Check if provider offers this service
-                if service in provider.services:
-                    # Check if provider covers this city
-                    if city in provider.cities:
-                        providers_with_service.append(provider)
-
-            if not providers_with_service:
-                logger.warning(f"No providers for {service} in {city}")
+            # One indexed query on the coverage table instead of loading
+            # every ACTIVE provider and scanning its JSON lists in Python.
+            # nulls_last keeps unrated providers behind rated ones on
+            # every backend (Postgres sorts NULLs first on DESC).
+            coverage = (
+                ProviderCoverage.objects.filter(
+                    provider__status="ACTIVE",
+                    service=service,
+                    city=city,
+                    is_available=True,
+                )
+                .select_related("provider")
+                .order_by(
+                    F("provider__rating").desc(nulls_last=True),
+                    "provider__total_leads_received",
+                )
+                .first()
+            )
+
+            if coverage is None:
+                logger.warning("No providers for %s in %s", service, city)
                 return None
 
-            # Rank by rating (highest first)
-            ranked = sorted(
-                providers_with_service,
-                key=lambda p: (-(p.rating or 0), p.total_leads_received),
+            cache.set(
+                cache_key,
+                coverage.provider_id,
+                ProviderMatchingService.MATCH_CACHE_TTL,
             )
-
-            # Return top provider
-            return ranked[0] if ranked else None
+            return coverage.provider
 
         except Exception as e:
-            logger.error(f"Error matching provider: {e}")
+            logger.error("Error matching provider: %s", e)
             return None
 
     @staticmethod
-    def get_providers_for_service_city(service, city):
+    def get_providers_for_service_city(service, city, limit=None):
         """
         Get all active providers for a service-city combo.
 
         Args:
             service: Service name
             city: City name
+            limit: Optional cap on how many providers to return
 
         Returns:
-            QuerySet of providers
+            List of providers, best-rated first
         """
-        from apps.providers.models import Provider
 
-        providers = []
+        coverage = (
+            ProviderCoverage.objects.filter(
+                provider__status="ACTIVE",
+                service=service,
+                city=city,
+                is_available=True,
+            )
+            .select_related("provider")
+            # Contact/ranking columns only - leave the bio and
+            # qualifications text blobs out of every row
+            .only(
+                "id",
+                "provider__id",
+                "provider__name",
+                "provider__email",
+                "provider__phone",
+                "provider__contact_method",
+                "provider__rating",
+                "provider__total_leads_received",
+                "provider__status",
+            )
+            .order_by(F("provider__rating").desc(nulls_last=True))
+        )
 
-        for provider in Provider.objects.filter(status="ACTIVE"):
-            if service in provider.services and city in provider.cities:
-                providers.append(provider)
+        if limit is not None:
+            coverage = coverage[:limit]
 
-        # Sort by rating (highest first)
-        return sorted(providers, key=lambda p: -(p.rating or 0))
+        # Stream in chunks so a popular pair never materialises the whole
+        # result set twice (cursor cache + list)
+        return [c.provider for c in coverage.iterator(chunk_size=500)]
 
 
 class TwilioService:
@@ -390,8 +522,6 @@ class TwilioService:
         Returns:
             dict with call_sid and status
         """
-        from apps.leads.models import TwilioCall, Lead
-
         try:
             # In production, use real Twilio SDK:
             # from twilio.rest import Client
@@ -399,10 +529,13 @@ class TwilioService:
             # call = client.calls.create(...)
 
             # For now, this is a placeholder
-            import uuid
+            import secrets
+
             from django.conf import settings
 
-            call_sid = str(uuid.uuid4())
+            # CA prefix mimics real Twilio call SIDs; token_hex skips the
+            # UUID object construction and hyphen formatting
+            call_sid = "CA" + secrets.token_hex(16)
 
             # Create call record
             call = TwilioCall.objects.create(
@@ -413,7 +546,7 @@ class TwilioService:
                 status="INITIATED",
             )
 
-            logger.info(f"Call initiated: {call_sid} to {to_number}")
+            logger.info("Call initiated: %s to %s", call_sid, to_number)
 
             return {
                 "success": True,
@@ -422,7 +555,7 @@ class TwilioService:
             }
 
         except Exception as e:
-            logger.error(f"Error making call: {e}")
+            logger.error("Error making call: %s", e)
             return {"success": False, "error": str(e)}
 
     @staticmethod
@@ -439,17 +572,17 @@ class TwilioService:
         Returns:
             dict with message_sid and status
         """
-        from apps.leads.models import TwilioMessage, Lead
-
         try:
             # In production:
             # from twilio.rest import Client
             # client.messages.create(...)
 
-            import uuid
+            import secrets
+
             from django.conf import settings
 
-            message_sid = str(uuid.uuid4())
+            # SM prefix mimics real Twilio message SIDs (see make_call)
+            message_sid = "SM" + secrets.token_hex(16)
 
             # Create message record
             msg = TwilioMessage.objects.create(
@@ -462,7 +595,7 @@ class TwilioService:
                 status="QUEUED",
             )
 
-            logger.info(f"Message queued: {message_sid} to {to_number}")
+            logger.info("Message queued: %s to %s", message_sid, to_number)
 
             return {
                 "success": True,
@@ -471,7 +604,7 @@ class TwilioService:
             }
 
         except Exception as e:
-            logger.error(f"Error sending message: {e}")
+            logger.error("Error sending message: %s", e)
             return {"success": False, "error": str(e)}
 
     @staticmethod
@@ -489,8 +622,6 @@ class TwilioService:
         Returns:
             dict with processing result
         """
-        from apps.leads.models import TwilioCall, TwilioMessage, Lead
-
         try:
             # Determine if call or message
             if "CallSid" in data:
@@ -501,72 +632,201 @@ class TwilioService:
                 return {"success": False, "error": "Unknown webhook type"}
 
         except Exception as e:
-            logger.error(f"Webhook error: {e}")
+            logger.error("Webhook error: %s", e)
             return {"success": False, "error": str(e)}
 
     @staticmethod
-    def _handle_call_webhook(data):
-        """Handle call status webhook from Twilio."""
-        from apps.leads.models import TwilioCall, Lead
+    def handle_webhook_batch(payloads):
+        """
+        Apply a burst of Twilio webhooks in a fixed number of statements.
 
-        try:
-            call_sid = data.get("CallSid")
-            call_status = data.get("CallStatus")
+        Campaign callbacks can arrive many per second; processing each
+        through handle_webhook costs a transaction per event. This
+        groups the batch by type and issues one Case/When UPDATE per
+        table, one bulk qualify UPDATE, and one bulk_create of the
+        QUALIFIED events, regardless of batch size.
 
-            # Find call record
-            call = TwilioCall.objects.get(call_sid=call_sid)
+        Args:
+            payloads: List of webhook payload dicts
 
-            # Update status
-            call.status = call_status.upper()
-            call.duration_seconds = int(data.get("CallDuration", 0))
-            call.save()
+        Returns:
+            dict with per-type counts
+        """
+        from django.db.models import Case, CharField, IntegerField, Value, When
 
-            # If answered/voicemail, mark lead as qualified
-            if call_status in ["completed", "answered"]:
-                if call.lead:
-                    LeadService.mark_lead_qualified(call.lead, triggered_by="TWILIO")
 
-            logger.info(f"Call {call_sid} status: {call_status}")
+        # Last status per SID wins within the window
+        calls = {}
+        messages = {}
+        for data in payloads:
+            if "CallSid" in data:
+                calls[data["CallSid"]] = data
+            elif "MessageSid" in data:
+                messages[data["MessageSid"]] = data
 
-            return {"success": True, "call_sid": call_sid, "status": call_status}
+        now = timezone.now()
+        qualifying_lead_ids = set()
+
+        if calls:
+            TwilioCall.objects.filter(call_sid__in=calls).update(
+                status=Case(
+                    *[
+                        When(call_sid=sid, then=Value(d["CallStatus"].upper()))
+                        for sid, d in calls.items()
+                    ],
+                    output_field=CharField(),
+                ),
+                duration_seconds=Case(
+                    *[
+                        When(call_sid=sid, then=Value(int(d.get("CallDuration", 0))))
+                        for sid, d in calls.items()
+                    ],
+                    output_field=IntegerField(),
+                ),
+                updated_at=now,
+            )
 
-        except TwilioCall.DoesNotExist:
-            logger.warning(f"Call not found: {call_sid}")
-            return {"success": False, "error": "Call not found"}
+            answered = [
+                sid
+                for sid, d in calls.items()
+                if d["CallStatus"] in ["completed", "answered"]
+            ]
+            if answered:
+                qualifying_lead_ids.update(
+                    TwilioCall.objects.filter(call_sid__in=answered).values_list(
+                        "lead_id", flat=True
+                    )
+                )
+
+        if messages:
+            TwilioMessage.objects.filter(message_sid__in=messages).update(
+                status=Case(
+                    *[
+                        When(message_sid=sid, then=Value(d["MessageStatus"].upper()))
+                        for sid, d in messages.items()
+                    ],
+                    output_field=CharField(),
+                ),
+                updated_at=now,
+            )
+
+            delivered = [
+                sid
+                for sid, d in messages.items()
+                if d["MessageStatus"] in ["delivered", "sent"]
+            ]
+            if delivered:
+                qualifying_lead_ids.update(
+                    TwilioMessage.objects.filter(message_sid__in=delivered).values_list(
+                        "lead_id", flat=True
+                    )
+                )
+
+        qualified_ids = []
+        if qualifying_lead_ids:
+            qualified_ids = list(
+                Lead.objects.filter(id__in=qualifying_lead_ids)
+                .exclude(status="QUALIFIED")
+                .values_list("id", flat=True)
+            )
+            if qualified_ids:
+                # Batch qualification skips the per-lead price resolution;
+                # billing falls back to resolving the price live
+                Lead.objects.filter(id__in=qualified_ids).update(
+                    status="QUALIFIED", qualified_at=now, updated_at=now
+                )
+                LeadService._flush_events(
+                    [
+                        LeadEvent(
+                            lead_id=lead_id,
+                            event_type="QUALIFIED",
+                            description="Lead became qualified for billing",
+                            triggered_by="TWILIO",
+                        )
+                        for lead_id in qualified_ids
+                    ]
+                )
+
+        logger.info(
+            "Webhook batch: %s calls, %s messages, %s qualified",
+            len(calls),
+            len(messages),
+            len(qualified_ids),
+        )
+
+        return {
+            "calls": len(calls),
+            "messages": len(messages),
+            "qualified": len(qualified_ids),
+        }
 
     @staticmethod
-    def _handle_message_webhook(data):
-        """Handle message status webhook from Twilio."""
-        from apps.leads.models import TwilioMessage
+    def _handle_call_webhook(data):
+        """Handle call status webhook from Twilio."""
+        call_sid = data.get("CallSid")
+        call_status = data.get("CallStatus")
+
+        # One UPDATE keyed on call_sid instead of SELECT-then-save; the
+        # row count doubles as the not-found check
+        updated = TwilioCall.objects.filter(call_sid=call_sid).update(
+            status=call_status.upper(),
+            duration_seconds=int(data.get("CallDuration", 0)),
+            updated_at=timezone.now(),
+        )
 
-        try:
-            message_sid = data.get("MessageSid")
-            message_status = data.get("MessageStatus")
+        if not updated:
+            logger.warning("Call not found: %s", call_sid)
+            return {"success": False, "error": "Call not found"}
 
-            # Find message record
-            message = TwilioMessage.objects.get(message_sid=message_sid)
+        # If answered/voicemail, mark lead as qualified (id-only lookup:
+        # no need to hydrate the Lead row on the webhook fast path)
+        if call_status in ["completed", "answered"]:
+            lead_id = (
+                TwilioCall.objects.filter(call_sid=call_sid)
+                .values_list("lead_id", flat=True)
+                .first()
+            )
+            if lead_id:
+                LeadService.mark_lead_qualified(lead_id, triggered_by="TWILIO")
 
-            # Update status
-            message.status = message_status.upper()
-            message.save()
+        logger.info("Call %s status: %s", call_sid, call_status)
 
-            # If delivered, mark lead as qualified
-            if message_status in ["delivered", "sent"]:
-                if message.lead:
-                    LeadService.mark_lead_qualified(message.lead, triggered_by="TWILIO")
+        return {"success": True, "call_sid": call_sid, "status": call_status}
 
-            logger.info(f"Message {message_sid} status: {message_status}")
+    @staticmethod
+    def _handle_message_webhook(data):
+        """Handle message status webhook from Twilio."""
+        message_sid = data.get("MessageSid")
+        message_status = data.get("MessageStatus")
 
-            return {
-                "success": True,
-                "message_sid": message_sid,
-                "status": message_status,
-            }
+        # Single UPDATE keyed on message_sid (see _handle_call_webhook)
+        updated = TwilioMessage.objects.filter(message_sid=message_sid).update(
+            status=message_status.upper(),
+            updated_at=timezone.now(),
+        )
 
-        except TwilioMessage.DoesNotExist:
-            logger.warning(f"Message not found: {message_sid}")
+        if not updated:
+            logger.warning("Message not found: %s", message_sid)
             return {"success": False, "error": "Message not found"}
 
+        # If delivered, mark lead as qualified (id only, see above)
+        if message_status in ["delivered", "sent"]:
+            lead_id = (
+                TwilioMessage.objects.filter(message_sid=message_sid)
+                .values_list("lead_id", flat=True)
+                .first()
+            )
+            if lead_id:
+                LeadService.mark_lead_qualified(lead_id, triggered_by="TWILIO")
+
+        logger.info("Message %s status: %s", message_sid, message_status)
+
+        return {
+            "success": True,
+            "message_sid": message_sid,
+            "status": message_status,
+        }
+
 
 class BillingService:
     """
@@ -574,37 +834,61 @@ class BillingService:
     """
 
     @staticmethod
-    def calculate_lead_cost(lead):
+    def resolve_lead_price(provider_id, service, city):
         """
-        Calculate how much provider should be charged for a lead.
+        Resolve the billable price for a provider/service/city combo.
 
         Args:
-            lead: Lead instance
+            provider_id: Provider primary key (may be None)
+            service: Service name
+            city: City name
 
         Returns:
             Decimal amount in GBP
         """
-        if not lead.provider:
+        # provider_id is a plain integer until the Phase 2 FK lands
+        if not provider_id:
             return Decimal("0.00")
 
         # Use provider's price per lead
-        price = lead.provider.price_per_lead or Decimal("0.00")
+        price = (
+            Provider.objects.filter(pk=provider_id)
+            .values_list("price_per_lead", flat=True)
+            .first()
+        ) or Decimal("0.00")
 
         # Check for location-based pricing override
-        from apps.providers.models import ProviderCoverage
-
-        try:
-            coverage = ProviderCoverage.objects.get(
-                provider=lead.provider, service=lead.service, city=lead.city
+        override = (
+            ProviderCoverage.objects.filter(
+                provider_id=provider_id, service=service, city=city
             )
+            .values_list("price_for_this_location", flat=True)
+            .first()
+        )
+        if override:
+            price = override
 
-            if coverage.price_for_this_location:
-                price = coverage.price_for_this_location
+        return price
 
-        except ProviderCoverage.DoesNotExist:
-            pass
+    @staticmethod
+    def calculate_lead_cost(lead):
+        """
+        Calculate how much provider should be charged for a lead.
 
-        return price
+        Args:
+            lead: Lead instance
+
+        Returns:
+            Decimal amount in GBP
+        """
+        # Qualification stores the resolved price on the lead, so billing
+        # normally costs zero extra queries
+        if lead.effective_price is not None:
+            return lead.effective_price
+
+        return BillingService.resolve_lead_price(
+            lead.provider_id, lead.service, lead.city
+        )
 
     @staticmethod
     def bill_lead(lead):
@@ -612,54 +896,99 @@ class BillingService:
         Bill a qualified lead to provider.
 
         Args:
-            lead: Lead instance
+            lead: Lead instance or lead ID
 
         Returns:
             dict with billing result
         """
-        from apps.leads.models import LeadEvent
+        lead_id = lead if isinstance(lead, int) else lead.pk
 
         try:
-            if lead.is_billed:
-                return {"success": False, "error": "Already billed"}
+            # Lock the lead so two workers cannot both pass the is_billed
+            # check and bill twice; the lead update, event insert and
+            # provider increment commit (and fsync) as one transaction.
+            # only() keeps the locked read to the billing columns instead
+            # of dragging the notes text blob along.
+            with transaction.atomic():
+                locked = (
+                    Lead.objects.select_for_update()
+                    .only(
+                        "id",
+                        "status",
+                        "is_billed",
+                        "provider_id",
+                        "service",
+                        "city",
+                        "effective_price",
+                    )
+                    .get(pk=lead_id)
+                )
 
-            if lead.status != "QUALIFIED":
-                return {"success": False, "error": "Lead not qualified"}
+                if locked.is_billed:
+                    return {"success": False, "error": "Already billed"}
+
+                if locked.status != "QUALIFIED":
+                    return {"success": False, "error": "Lead not qualified"}
+
+                # Calculate cost
+                amount = BillingService.calculate_lead_cost(locked)
+
+                # Update lead (only the billing columns, not the text blobs)
+                locked.is_billed = True
+                locked.billed_at = timezone.now()
+                locked.amount_billed = amount
+                locked.save(
+                    update_fields=[
+                        "is_billed",
+                        "billed_at",
+                        "amount_billed",
+                        "updated_at",
+                    ]
+                )
 
-            # Calculate cost
-            amount = BillingService.calculate_lead_cost(lead)
+                # Log billing
+                LeadEvent.objects.create(
+                    lead=locked,
+                    event_type="BILLED",
+                    description=f"Billed £{amount} to provider {locked.provider_id}",
+                    triggered_by="SYSTEM",
+                )
 
-            # Update lead
-            lead.is_billed = True
-            lead.billed_at = timezone.now()
-            lead.amount_billed = amount
-            lead.save()
+                # Atomic SQL-level increments: no read-modify-write race
+                # with concurrent billing runs
+                Provider.objects.filter(pk=locked.provider_id).update(
+                    total_leads_received=F("total_leads_received") + 1,
+                    total_paid=F("total_paid") + amount,
+                )
 
-            # Log billing
-            LeadEvent.objects.create(
-                lead=lead,
-                event_type="BILLED",
-                description=f"Billed £{amount} to {lead.provider.name}",
-                triggered_by="SYSTEM",
-            )
+            if not isinstance(lead, int):
+                lead.is_billed = locked.is_billed
+                lead.billed_at = locked.billed_at
+                lead.amount_billed = locked.amount_billed
 
-            # Update provider stats
-            lead.provider.total_leads_received += 1
-            lead.provider.total_paid += amount
-            lead.provider.save()
+            # The leads-received counter just moved: drop the cached match
+            # so the next lead re-ranks providers for this pair
+            from django.core.cache import cache
+
+            cache.delete(
+                ProviderMatchingService.match_cache_key(locked.service, locked.city)
+            )
 
             logger.info(
-                f"Lead {lead.id} billed £{amount} to provider {lead.provider.id}"
+                "Lead %s billed £%s to provider %s",
+                lead_id,
+                amount,
+                locked.provider_id,
             )
 
             return {
                 "success": True,
                 "amount": amount,
-                "provider_id": lead.provider.id,
+                "provider_id": locked.provider_id,
             }
 
         except Exception as e:
-            logger.error(f"Billing error: {e}")
+            logger.error("Billing error: %s", e)
             return {"success": False, "error": str(e)}
 
 
@@ -0,0 +1,70 @@
+"""
+Leads App Tasks
+===============
+Celery tasks for lead contact and Twilio I/O.
+
+Twilio calls are 100-500ms HTTPS round-trips; running them inline would
+serialise lead routing behind external API latency. These tasks keep
+the routing path DB-bound and push the I/O onto workers.
+"""
+
+from celery import shared_task
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Contact attempts older than this are pointless to deliver - the lead
+# has likely been expired or re-routed. Pass as expires= when enqueuing.
+CONTACT_TASK_EXPIRES = 300
+
+
+@shared_task
+def send_provider_contact(lead_id, provider_id):
+    """
+    Attempt Twilio contact for a routed lead.
+
+    Args:
+        lead_id: Lead primary key
+        provider_id: Provider primary key
+
+    Returns:
+        dict with the contact attempt result
+    """
+    from apps.leads.models import Lead
+    from apps.leads.services import LeadService
+    from apps.providers.models import Provider
+
+    try:
+        lead = Lead.objects.get(id=lead_id)
+        provider = Provider.objects.get(id=provider_id)
+    except (Lead.DoesNotExist, Provider.DoesNotExist) as e:
+        logger.error("Contact task skipped for lead %s: %s", lead_id, e)
+        return {"error": str(e)}
+
+    return LeadService.contact_provider_via_twilio(lead, provider)
+
+
+@shared_task
+def flush_twilio_webhooks(payloads):
+    """
+    Apply a micro-batch of buffered Twilio webhook payloads.
+
+    The HTTP endpoint can enqueue bursts (e.g. a 50-100ms window's
+    worth) as one task instead of processing each callback in its own
+    transaction.
+
+    Args:
+        payloads: List of webhook payload dicts
+
+    Returns:
+        dict with per-type counts
+    """
+    from apps.leads.services import TwilioService
+
+    return TwilioService.handle_webhook_batch(payloads)
+
+
+__all__ = [
+    "send_provider_contact",
+    "flush_twilio_webhooks",
+]
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ProvidersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.providers"
+
+    def ready(self):
+        # Register cache-invalidation signal receivers
+        from apps.providers import signals  # noqa: F401
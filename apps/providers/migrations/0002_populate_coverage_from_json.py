@@ -0,0 +1,48 @@
+"""
+Backfill ProviderCoverage from the Provider.services/cities JSON lists.
+
+Matching now queries the indexed ProviderCoverage table (see
+ProviderMatchingService), so every provider onboarded before coverage
+rows existed needs the cartesian product of their services x cities
+materialised. The JSON fields stay as a cached summary for admin
+display only.
+"""
+
+from django.db import migrations
+
+
+def populate_coverage_from_json(apps, schema_editor):
+    Provider = apps.get_model("providers", "Provider")
+    ProviderCoverage = apps.get_model("providers", "ProviderCoverage")
+
+    existing = set(
+        ProviderCoverage.objects.values_list("provider_id", "service", "city")
+    )
+
+    to_create = []
+    for provider_id, services, cities in Provider.objects.values_list(
+        "id", "services", "cities"
+    ).iterator(chunk_size=500):
+        for service in services or []:
+            for city in cities or []:
+                if (provider_id, service, city) not in existing:
+                    to_create.append(
+                        ProviderCoverage(
+                            provider_id=provider_id, service=service, city=city
+                        )
+                    )
+
+    ProviderCoverage.objects.bulk_create(to_create, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("providers", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_coverage_from_json, migrations.RunPython.noop
+        ),
+    ]
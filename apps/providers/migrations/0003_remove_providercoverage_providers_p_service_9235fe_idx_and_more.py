@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-31 13:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('providers', '0002_populate_coverage_from_json'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='providercoverage',
+            name='providers_p_service_9235fe_idx',
+        ),
+        migrations.AddIndex(
+            model_name='providercoverage',
+            index=models.Index(fields=['service', 'city', 'is_available'], name='providers_p_service_efabf6_idx'),
+        ),
+    ]
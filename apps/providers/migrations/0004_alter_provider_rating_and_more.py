@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-31 13:20
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('providers', '0003_remove_providercoverage_providers_p_service_9235fe_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='provider',
+            name='rating',
+            field=models.FloatField(blank=True, help_text='Average rating from consumer feedback (0-5)', null=True, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(5)]),
+        ),
+        migrations.AddIndex(
+            model_name='provider',
+            index=models.Index(fields=['-rating', 'total_leads_received'], name='providers_p_rating_cbb76b_idx'),
+        ),
+    ]
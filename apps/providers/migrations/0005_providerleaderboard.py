@@ -0,0 +1,30 @@
+# Generated by Django 5.2.17 on 2026-08-31 13:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('providers', '0004_alter_provider_rating_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProviderLeaderboard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rating', models.FloatField(default=0, help_text='Provider rating at compute time (0 if unrated)')),
+                ('lead_count', models.IntegerField(default=0, help_text='Total leads at compute time')),
+                ('stats', models.JSONField(default=dict, help_text='Precomputed stats dict for this provider')),
+                ('computed_at', models.DateTimeField(help_text='When this row was last recomputed')),
+                ('provider', models.OneToOneField(help_text='Provider this ranking row belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entry', to='providers.provider')),
+            ],
+            options={
+                'verbose_name': 'Provider Leaderboard Entry',
+                'verbose_name_plural': 'Provider Leaderboard Entries',
+                'indexes': [models.Index(fields=['-rating', '-lead_count'], name='providers_p_rating_81fe13_idx')],
+            },
+        ),
+    ]
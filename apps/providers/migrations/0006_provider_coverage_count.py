@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-31 13:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('providers', '0005_providerleaderboard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='provider',
+            name='coverage_count',
+            field=models.PositiveIntegerField(default=0, help_text='Denormalized count of coverage rows, maintained by signals'),
+        ),
+    ]
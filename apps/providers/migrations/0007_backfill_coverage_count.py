@@ -0,0 +1,39 @@
+"""
+Backfill Provider.coverage_count from existing ProviderCoverage rows.
+
+The counter is maintained by signals from here on; this sets the
+starting values. Idempotent - rerunning just rewrites the same counts.
+"""
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def backfill_coverage_count(apps, schema_editor):
+    Provider = apps.get_model("providers", "Provider")
+    ProviderCoverage = apps.get_model("providers", "ProviderCoverage")
+
+    counts = (
+        ProviderCoverage.objects.values("provider_id")
+        .annotate(total=Count("id"))
+        .values_list("provider_id", "total")
+    )
+
+    for provider_id, total in counts:
+        Provider.objects.filter(pk=provider_id).update(coverage_count=total)
+
+
+def noop(apps, schema_editor):
+    # Field removal on reverse handles cleanup
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("providers", "0006_provider_coverage_count"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_coverage_count, noop),
+    ]
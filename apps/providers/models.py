@@ -10,7 +10,7 @@ Key Models:
 """
 
 from django.db import models
-from django.core.validators import URLValidator, MinValueValidator
+from django.core.validators import URLValidator, MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from decimal import Decimal
 
@@ -111,12 +111,16 @@ class Provider(models.Model):
     rating = models.FloatField(
         null=True,
         blank=True,
-        validators=[MinValueValidator(0), MinValueValidator(5)],
+        validators=[MinValueValidator(0), MaxValueValidator(5)],
         help_text="Average rating from consumer feedback (0-5)",
     )
     total_leads_received = models.IntegerField(
         default=0, help_text="Total qualified leads sent to this provider"
     )
+    coverage_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Denormalized count of coverage rows, maintained by signals",
+    )
     total_paid = models.DecimalField(
         max_digits=15,
         decimal_places=2,
@@ -139,6 +143,8 @@ class Provider(models.Model):
             models.Index(fields=["email"]),
             models.Index(fields=["status"]),
             models.Index(fields=["-created_at"]),
+            # Matching orders by rating then leads received
+            models.Index(fields=["-rating", "total_leads_received"]),
         ]
 
     def __str__(self):
@@ -200,14 +206,59 @@ class ProviderCoverage(models.Model):
         verbose_name_plural = "Provider Coverages"
         indexes = [
             models.Index(fields=["provider", "service"]),
-            models.Index(fields=["service", "city"]),
+            # Matching filters on all three columns
+            models.Index(fields=["service", "city", "is_available"]),
         ]
 
     def __str__(self):
         return f"{self.provider.name} - {self.service} in {self.city}"
 
 
+class ProviderLeaderboard(models.Model):
+    """
+    Precomputed top-provider ranking.
+
+    get_top_providers used to aggregate every lead on every call. A
+    periodic task (providers.tasks.refresh_provider_leaderboard) now
+    recomputes this table, so reads are an indexed ORDER BY + LIMIT and
+    the aggregation cost is paid once per refresh interval.
+    """
+
+    provider = models.OneToOneField(
+        Provider,
+        on_delete=models.CASCADE,
+        related_name="leaderboard_entry",
+        help_text="Provider this ranking row belongs to",
+    )
+
+    # Ranking columns, denormalized for the ORDER BY
+    rating = models.FloatField(
+        default=0, help_text="Provider rating at compute time (0 if unrated)"
+    )
+    lead_count = models.IntegerField(
+        default=0, help_text="Total leads at compute time"
+    )
+
+    # Full payload served by get_top_providers
+    stats = models.JSONField(
+        default=dict, help_text="Precomputed stats dict for this provider"
+    )
+
+    computed_at = models.DateTimeField(help_text="When this row was last recomputed")
+
+    class Meta:
+        verbose_name = "Provider Leaderboard Entry"
+        verbose_name_plural = "Provider Leaderboard Entries"
+        indexes = [
+            models.Index(fields=["-rating", "-lead_count"]),
+        ]
+
+    def __str__(self):
+        return f"Leaderboard: provider {self.provider_id} ({self.rating})"
+
+
 __all__ = [
     "Provider",
     "ProviderCoverage",
+    "ProviderLeaderboard",
 ]
@@ -10,13 +10,49 @@ Services:
 - CoverageService: Service-city coverage management
 """
 
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
-from django.db.models import Count, Q, Avg
+from django.db.models import Count, F, Q
+from datetime import timedelta
 from decimal import Decimal
+import hmac
+import json
 import logging
+import secrets
+import uuid
+
+# Resolved once at import time: the per-call function-body imports still
+# hit sys.modules and the import lock on every service invocation, which
+# adds up at request rate. Nothing here is circular - models and utils
+# import no services.
+from apps.core.utils import CacheHelper
+from apps.leads.models import Lead
+from apps.providers.models import Provider, ProviderCoverage, ProviderLeaderboard
 
 logger = logging.getLogger(__name__)
 
+# Fields callers may change through update_provider. Status, verification
+# flags, lead counters and timestamps all have dedicated code paths and
+# must not be writable via arbitrary kwargs.
+_PROVIDER_UPDATABLE = frozenset(
+    {
+        "name",
+        "email",
+        "phone",
+        "company_name",
+        "company_website",
+        "bio",
+        "qualifications",
+        "services",
+        "cities",
+        "contact_method",
+        "pricing_model",
+        "price_per_lead",
+        "rating",
+    }
+)
+
 
 class ProviderService:
     """
@@ -45,8 +81,6 @@ class ProviderService:
         Returns:
             dict with provider and status
         """
-        from apps.providers.models import Provider
-
         try:
             # Create provider
             provider = Provider.objects.create(
@@ -59,7 +93,7 @@ class ProviderService:
                 **kwargs,
             )
 
-            logger.info(f"Created provider: {provider.id} - {name}")
+            logger.info("Created provider: %s - %s", provider.id, name)
 
             return {
                 "success": True,
@@ -68,7 +102,7 @@ class ProviderService:
             }
 
         except Exception as e:
-            logger.error(f"Error creating provider: {e}")
+            logger.exception("Error creating provider")
             return {"success": False, "error": str(e)}
 
     @staticmethod
@@ -83,27 +117,29 @@ class ProviderService:
         Returns:
             dict with updated provider
         """
-        from apps.providers.models import Provider
-
         try:
-            provider = Provider.objects.get(id=provider_id)
+            # Keep only whitelisted fields, then issue one UPDATE of just
+            # those columns - no SELECT first, and no rewriting of the
+            # whole row (JSON lists, bio, ...) the way save() would.
+            updates = {
+                field: value
+                for field, value in kwargs.items()
+                if field in _PROVIDER_UPDATABLE
+            }
 
-            # Update fields
-            for field, value in kwargs.items():
-                if hasattr(provider, field):
-                    setattr(provider, field, value)
+            updated = Provider.objects.filter(id=provider_id).update(
+                **updates, updated_at=timezone.now()
+            )
 
-            provider.updated_at = timezone.now()
-            provider.save()
+            if updated == 0:
+                return {"success": False, "error": "Provider not found"}
 
-            logger.info(f"Updated provider: {provider_id}")
+            logger.info("Updated provider: %s", provider_id)
 
-            return {"success": True, "provider": provider}
+            return {"success": True, "provider": Provider.objects.get(id=provider_id)}
 
-        except Provider.DoesNotExist:
-            return {"success": False, "error": "Provider not found"}
         except Exception as e:
-            logger.error(f"Error updating provider: {e}")
+            logger.exception("Error updating provider")
             return {"success": False, "error": str(e)}
 
     @staticmethod
@@ -117,23 +153,21 @@ class ProviderService:
         Returns:
             dict with result
         """
-        from apps.providers.models import Provider
-
         try:
-            provider = Provider.objects.get(id=provider_id)
+            now = timezone.now()
+            updated = Provider.objects.filter(id=provider_id).update(
+                status="ACTIVE", verified_at=now, updated_at=now
+            )
 
-            provider.status = "ACTIVE"
-            provider.verified_at = timezone.now()
-            provider.save()
+            if updated == 0:
+                return {"success": False, "error": "Provider not found"}
 
-            logger.info(f"Activated provider: {provider_id}")
+            logger.info("Activated provider: %s", provider_id)
 
-            return {"success": True, "provider": provider}
+            return {"success": True}
 
-        except Provider.DoesNotExist:
-            return {"success": False, "error": "Provider not found"}
         except Exception as e:
-            logger.error(f"Error activating provider: {e}")
+            logger.exception("Error activating provider")
             return {"success": False, "error": str(e)}
 
     @staticmethod
@@ -148,22 +182,20 @@ class ProviderService:
         Returns:
             dict with result
         """
-        from apps.providers.models import Provider
-
         try:
-            provider = Provider.objects.get(id=provider_id)
+            updated = Provider.objects.filter(id=provider_id).update(
+                status="PAUSED", updated_at=timezone.now()
+            )
 
-            provider.status = "PAUSED"
-            provider.save()
+            if updated == 0:
+                return {"success": False, "error": "Provider not found"}
 
-            logger.info(f"Paused provider: {provider_id} - {reason}")
+            logger.info("Paused provider: %s - %s", provider_id, reason)
 
-            return {"success": True, "provider": provider}
+            return {"success": True}
 
-        except Provider.DoesNotExist:
-            return {"success": False, "error": "Provider not found"}
         except Exception as e:
-            logger.error(f"Error pausing provider: {e}")
+            logger.exception("Error pausing provider")
             return {"success": False, "error": str(e)}
 
     @staticmethod
@@ -178,22 +210,20 @@ class ProviderService:
         Returns:
             dict with result
         """
-        from apps.providers.models import Provider
-
         try:
-            provider = Provider.objects.get(id=provider_id)
+            updated = Provider.objects.filter(id=provider_id).update(
+                status="INACTIVE", updated_at=timezone.now()
+            )
 
-            provider.status = "INACTIVE"
-            provider.save()
+            if updated == 0:
+                return {"success": False, "error": "Provider not found"}
 
-            logger.info(f"Deactivated provider: {provider_id} - {reason}")
+            logger.info("Deactivated provider: %s - %s", provider_id, reason)
 
-            return {"success": True, "provider": provider}
+            return {"success": True}
 
-        except Provider.DoesNotExist:
-            return {"success": False, "error": "Provider not found"}
         except Exception as e:
-            logger.error(f"Error deactivating provider: {e}")
+            logger.exception("Error deactivating provider")
             return {"success": False, "error": str(e)}
 
     @staticmethod
@@ -209,41 +239,53 @@ class ProviderService:
         Returns:
             QuerySet of providers
         """
-        from apps.providers.models import Provider
-
         providers = Provider.objects.all()
 
         if status:
             providers = providers.filter(status=status)
 
-        # Filter by service and city if provided
-        if service or city:
-            filtered = []
-            for provider in providers:
-                if service and service not in provider.services:
-                    continue
-                if city and city not in provider.cities:
-                    continue
-                filtered.append(provider)
-            return filtered
+        # Push the predicate into the indexed coverage table instead of
+        # scanning every provider's JSON lists in Python. A single
+        # filter() call constrains one coverage row, so service + city
+        # means "covers that service in that city".
+        coverage_filter = {}
+        if service:
+            coverage_filter["coverage__service"] = service
+        if city:
+            coverage_filter["coverage__city"] = city
+        if coverage_filter:
+            providers = providers.filter(**coverage_filter).distinct()
 
         return providers
 
+    # Dashboards poll provider details; a short TTL plus signal-driven
+    # invalidation keeps hot reads off the database
+    DETAILS_CACHE_TTL = 60
+
+    @staticmethod
+    def details_cache_key(provider_id):
+        """Cache key for a provider's details payload"""
+        return f"provider_details:{provider_id}"
+
     @staticmethod
     def get_provider_details(provider_id):
         """
         Get detailed provider information.
 
+        Results are cached briefly; saves to the provider or its
+        coverage drop the entry immediately (see signals.py).
+
         Args:
             provider_id: Provider ID
 
         Returns:
             dict with provider data and stats
         """
-        from apps.providers.models import Provider
-
-        try:
-            provider = Provider.objects.get(id=provider_id)
+        def build():
+            try:
+                provider = Provider.objects.get(id=provider_id)
+            except Provider.DoesNotExist:
+                return None
 
             return {
                 "provider": provider,
@@ -253,11 +295,60 @@ class ProviderService:
                 "total_paid": provider.total_paid,
                 "rating": provider.rating,
                 "status": provider.status,
-                "coverage_count": provider.coverage.count(),
+                "coverage_count": provider.coverage_count,
             }
 
-        except Provider.DoesNotExist:
-            return None
+        return CacheHelper.get_or_compute(
+            ProviderService.details_cache_key(provider_id),
+            build,
+            timeout=ProviderService.DETAILS_CACHE_TTL,
+        )
+
+    @staticmethod
+    def details_json_cache_key(provider_id):
+        """Cache key for the pre-serialized details payload"""
+        return f"provider_details_json:{provider_id}"
+
+    @staticmethod
+    def get_provider_details_json(provider_id):
+        """
+        Get provider details as compact, pre-serialized JSON bytes.
+
+        API reads can hand these bytes straight to an HttpResponse: the
+        payload is serialized once per cache fill, so hot requests skip
+        both the ORM queries and json.dumps entirely. Decimals are
+        converted to floats at fill time rather than per request.
+        Invalidated with the other read caches (see signals.py).
+
+        Args:
+            provider_id: Provider ID
+
+        Returns:
+            JSON bytes, or None if the provider does not exist
+        """
+        def build():
+            details = ProviderService.get_provider_details(provider_id)
+            if details is None:
+                return None
+
+            payload = {
+                "provider_id": provider_id,
+                "name": details["provider"].name,
+                "status": details["status"],
+                "services": details["services"],
+                "cities": details["cities"],
+                "total_leads": details["total_leads"],
+                "total_paid": float(details["total_paid"]),
+                "rating": details["rating"],
+                "coverage_count": details["coverage_count"],
+            }
+            return json.dumps(payload, separators=(",", ":")).encode()
+
+        return CacheHelper.get_or_compute(
+            ProviderService.details_json_cache_key(provider_id),
+            build,
+            timeout=ProviderService.DETAILS_CACHE_TTL,
+        )
 
 
 class ProviderVerificationService:
@@ -281,15 +372,13 @@ class ProviderVerificationService:
         Returns:
             dict with verification result
         """
-        from apps.providers.models import Provider
-        from apps.core.utils import CacheHelper
-        import random
-
         try:
             provider = Provider.objects.get(id=provider_id)
 
-            # Generate verification code
-            code = str(random.randint(100000, 999999))
+            # Generate verification code. secrets draws from os.urandom,
+            # so codes are unpredictable and there is no shared-generator
+            # lock under concurrent onboarding.
+            code = f"{secrets.randbelow(900000) + 100000:06d}"
 
             # Store in cache (valid for 10 minutes)
             cache_key = f"provider_verify:{provider_id}"
@@ -302,7 +391,7 @@ class ProviderVerificationService:
             #     message=f"Your verification code is: {code}"
             # )
 
-            logger.info(f"Phone verification sent to provider {provider_id}")
+            logger.info("Phone verification sent to provider %s", provider_id)
 
             return {
                 "success": True,
@@ -312,9 +401,48 @@ class ProviderVerificationService:
         except Provider.DoesNotExist:
             return {"success": False, "error": "Provider not found"}
         except Exception as e:
-            logger.error(f"Verification error: {e}")
+            logger.exception("Verification error")
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def send_phone_verification_batch(provider_ids):
+        """
+        Send verification codes to many providers in one batch.
+
+        Bulk onboarding pays one cache round-trip (set_many) for the
+        whole batch instead of one per provider, and in production one
+        Twilio Messaging Service request per batch instead of one HTTPS
+        call per SMS.
+
+        Args:
+            provider_ids: Iterable of Provider IDs
+
+        Returns:
+            dict with per-provider results
+        """
+        providers = list(
+            Provider.objects.filter(id__in=provider_ids).only("id", "phone")
+        )
+
+        codes = {
+            f"provider_verify:{provider.id}": f"{secrets.randbelow(900000) + 100000:06d}"
+            for provider in providers
+        }
+
+        # One round-trip for the whole batch (valid for 10 minutes)
+        CacheHelper.set_many(codes, timeout=600)
+
+        # In production, send the batch through a Twilio Messaging
+        # Service instead of one client.messages.create per provider
+
+        logger.info("Phone verification batch sent to %s providers", len(providers))
+
+        return {
+            "success": True,
+            "sent": len(providers),
+            "missing": len(set(provider_ids)) - len(providers),
+        }
+
     @staticmethod
     def verify_phone_code(provider_id, code):
         """
@@ -327,20 +455,18 @@ class ProviderVerificationService:
         Returns:
             dict with verification result
         """
-        from apps.providers.models import Provider
-        from apps.core.utils import CacheHelper
-
         try:
             provider = Provider.objects.get(id=provider_id)
 
             # Get stored code from cache
             cache_key = f"provider_verify:{provider_id}"
-            stored_code = CacheHelper.get_or_none(cache_key)
+            stored_code = CacheHelper.get_or_none(None, cache_key)
 
             if not stored_code:
                 return {"success": False, "error": "Verification code expired"}
 
-            if str(code) != str(stored_code):
+            # Constant-time comparison - no timing side-channel on codes
+            if not hmac.compare_digest(str(code).encode(), str(stored_code).encode()):
                 return {"success": False, "error": "Invalid verification code"}
 
             # Mark as verified
@@ -348,18 +474,17 @@ class ProviderVerificationService:
             provider.save()
 
             # Clear cache
-            from django.core.cache import cache
 
             cache.delete(cache_key)
 
-            logger.info(f"Phone verified for provider {provider_id}")
+            logger.info("Phone verified for provider %s", provider_id)
 
             return {"success": True, "message": "Phone verified successfully"}
 
         except Provider.DoesNotExist:
             return {"success": False, "error": "Provider not found"}
         except Exception as e:
-            logger.error(f"Verification error: {e}")
+            logger.exception("Verification error")
             return {"success": False, "error": str(e)}
 
     @staticmethod
@@ -373,10 +498,6 @@ class ProviderVerificationService:
         Returns:
             dict with result
         """
-        from apps.providers.models import Provider
-        from apps.core.utils import CacheHelper
-        import uuid
-
         try:
             provider = Provider.objects.get(id=provider_id)
 
@@ -397,7 +518,7 @@ class ProviderVerificationService:
             #     recipient_list=[provider.email]
             # )
 
-            logger.info(f"Email verification sent to {provider.email}")
+            logger.info("Email verification sent to %s", provider.email)
 
             return {
                 "success": True,
@@ -407,7 +528,7 @@ class ProviderVerificationService:
         except Provider.DoesNotExist:
             return {"success": False, "error": "Provider not found"}
         except Exception as e:
-            logger.error(f"Email verification error: {e}")
+            logger.exception("Email verification error")
             return {"success": False, "error": str(e)}
 
 
@@ -435,8 +556,6 @@ class CoverageService:
         Returns:
             dict with coverage object
         """
-        from apps.providers.models import Provider, ProviderCoverage
-
         try:
             provider = Provider.objects.get(id=provider_id)
 
@@ -448,21 +567,136 @@ class CoverageService:
                 defaults={"price_for_this_location": price, "is_available": True},
             )
 
-            # Update provider's services/cities lists
-            if service not in provider.services:
-                provider.services.append(service)
-            if city not in provider.cities:
-                provider.cities.append(city)
-            provider.save()
-
-            logger.info(f"Added coverage: {provider_id} - {service} in {city}")
+            # Update provider's cached services/cities lists under a row
+            # lock: appending to an unlocked copy races with concurrent
+            # coverage adds (last writer wins, silently dropping an
+            # entry). An existing coverage row means an earlier add
+            # already put this pair in the lists, so a price/availability
+            # refresh skips the lock, the re-read and the list scan
+            # entirely.
+            if created:
+                with transaction.atomic():
+                    locked = (
+                        Provider.objects.select_for_update()
+                        .only("id", "services", "cities")
+                        .get(id=provider_id)
+                    )
+                    dirty = False
+                    if service not in locked.services:
+                        locked.services.append(service)
+                        dirty = True
+                    if city not in locked.cities:
+                        locked.cities.append(city)
+                        dirty = True
+                    if dirty:
+                        locked.save(
+                            update_fields=["services", "cities", "updated_at"]
+                        )
+
+                provider.services = locked.services
+                provider.cities = locked.cities
+
+            logger.info("Added coverage: %s - %s in %s", provider_id, service, city)
 
             return {"success": True, "coverage": coverage, "created": created}
 
         except Provider.DoesNotExist:
             return {"success": False, "error": "Provider not found"}
         except Exception as e:
-            logger.error(f"Coverage error: {e}")
+            logger.exception("Coverage error")
+            return {"success": False, "error": str(e)}
+
+    @staticmethod
+    def bulk_add_coverage(provider_id, pairs):
+        """
+        Add or update many service-city coverage rows in one batch.
+
+        Onboarding flows that looped over add_coverage paid a SELECT, an
+        upsert and a provider save per pair. This computes everything
+        once: a single INSERT ... ON CONFLICT DO UPDATE for the coverage
+        rows and at most one UPDATE for the provider's JSON lists.
+
+        Args:
+            provider_id: Provider ID
+            pairs: Iterable of dicts with "service", "city" and
+                optional "price" keys
+
+        Returns:
+            dict with the number of rows written
+        """
+        try:
+            provider = Provider.objects.get(id=provider_id)
+
+            pairs = list(pairs)
+            rows = [
+                ProviderCoverage(
+                    provider_id=provider_id,
+                    service=pair["service"],
+                    city=pair["city"],
+                    price_for_this_location=pair.get("price"),
+                    is_available=True,
+                )
+                for pair in pairs
+            ]
+
+            ProviderCoverage.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["provider", "service", "city"],
+                update_fields=["price_for_this_location", "is_available", "updated_at"],
+            )
+
+            # Union the cached JSON lists, preserving existing order the
+            # way repeated add_coverage calls would
+            services = list(provider.services)
+            cities = list(provider.cities)
+            for pair in pairs:
+                if pair["service"] not in services:
+                    services.append(pair["service"])
+                if pair["city"] not in cities:
+                    cities.append(pair["city"])
+
+            # bulk_create bypasses the counter-maintaining signals, so
+            # recount once for the whole batch
+            total_coverage = ProviderCoverage.objects.filter(
+                provider_id=provider_id
+            ).count()
+
+            if (
+                services != provider.services
+                or cities != provider.cities
+                or total_coverage != provider.coverage_count
+            ):
+                Provider.objects.filter(id=provider_id).update(
+                    services=services,
+                    cities=cities,
+                    coverage_count=total_coverage,
+                    updated_at=timezone.now(),
+                )
+
+            # bulk_create bypasses post_save, so drop affected match
+            # cache entries here (the receivers normally handle this)
+            from apps.leads.services import ProviderMatchingService
+
+            cache.delete_many(
+                [
+                    ProviderMatchingService.match_cache_key(
+                        pair["service"], pair["city"]
+                    )
+                    for pair in pairs
+                ]
+            )
+
+            logger.info(
+                "Bulk coverage: provider %s, %s pairs", provider_id, len(pairs)
+            )
+
+            return {"success": True, "written": len(rows)}
+
+        except Provider.DoesNotExist:
+            return {"success": False, "error": "Provider not found"}
+        except Exception as e:
+            logger.exception("Coverage error")
             return {"success": False, "error": str(e)}
 
     @staticmethod
@@ -478,8 +712,6 @@ class CoverageService:
         Returns:
             dict with result
         """
-        from apps.providers.models import Provider, ProviderCoverage
-
         try:
             coverage = ProviderCoverage.objects.get(
                 provider_id=provider_id, service=service, city=city
@@ -487,14 +719,14 @@ class CoverageService:
 
             coverage.delete()
 
-            logger.info(f"Removed coverage: {provider_id} - {service} in {city}")
+            logger.info("Removed coverage: %s - %s in %s", provider_id, service, city)
 
             return {"success": True}
 
         except ProviderCoverage.DoesNotExist:
             return {"success": False, "error": "Coverage not found"}
         except Exception as e:
-            logger.error(f"Error removing coverage: {e}")
+            logger.exception("Error removing coverage")
             return {"success": False, "error": str(e)}
 
     @staticmethod
@@ -508,10 +740,13 @@ class CoverageService:
         Returns:
             QuerySet of ProviderCoverage
         """
-        from apps.providers.models import ProviderCoverage
 
-        return ProviderCoverage.objects.filter(provider_id=provider_id).order_by(
-            "service", "city"
+        # select_related so template access to coverage.provider doesn't
+        # re-query per row
+        return (
+            ProviderCoverage.objects.filter(provider_id=provider_id)
+            .select_related("provider")
+            .order_by("service", "city")
         )
 
     @staticmethod
@@ -525,24 +760,20 @@ class CoverageService:
         Returns:
             dict with result
         """
-        from apps.providers.models import ProviderCoverage
-
         try:
             coverage = ProviderCoverage.objects.get(id=coverage_id)
 
             coverage.is_available = not coverage.is_available
             coverage.save()
 
-            logger.info(
-                f"Toggled availability: {coverage_id} - {coverage.is_available}"
-            )
+            logger.info("Toggled availability: %s - %s", coverage_id, coverage.is_available)
 
             return {"success": True, "is_available": coverage.is_available}
 
         except ProviderCoverage.DoesNotExist:
             return {"success": False, "error": "Coverage not found"}
         except Exception as e:
-            logger.error(f"Error toggling availability: {e}")
+            logger.exception("Error toggling availability")
             return {"success": False, "error": str(e)}
 
 
@@ -557,34 +788,47 @@ class ProviderAnalyticsService:
     - Average rating
     """
 
+    # Same caching story as provider details: short TTL, invalidated by
+    # signals on provider/coverage/lead saves
+    STATS_CACHE_TTL = 60
+
+    @staticmethod
+    def stats_cache_key(provider_id):
+        """Cache key for a provider's stats payload"""
+        return f"provider_stats:{provider_id}"
+
     @staticmethod
     def get_provider_stats(provider_id):
         """
         Get comprehensive statistics for a provider.
 
+        Results are cached briefly; saves to the provider, its coverage
+        or its leads drop the entry immediately (see signals.py).
+
         Args:
             provider_id: Provider ID
 
         Returns:
             dict with provider statistics
         """
-        from apps.providers.models import Provider
-        from apps.leads.models import Lead
-        from datetime import timedelta
-
-        try:
-            provider = Provider.objects.get(id=provider_id)
-
-            # Get leads for this provider
-            all_leads = Lead.objects.filter(provider_id=provider_id)
-            leads_this_month = all_leads.filter(
-                created_at__gte=timezone.now() - timedelta(days=30)
+        def build():
+            try:
+                provider = Provider.objects.get(id=provider_id)
+            except Provider.DoesNotExist:
+                return None
+
+            # One conditional aggregate instead of four COUNT round-trips
+            cutoff = timezone.now() - timedelta(days=30)
+            lead_stats = Lead.objects.filter(provider_id=provider_id).aggregate(
+                total=Count("id"),
+                this_month=Count("id", filter=Q(created_at__gte=cutoff)),
+                qualified=Count("id", filter=Q(status="QUALIFIED")),
+                converted=Count("id", filter=Q(status="CONVERTED")),
             )
 
-            # Calculate stats
-            total_leads = all_leads.count()
-            qualified_leads = all_leads.filter(status="QUALIFIED").count()
-            converted_leads = all_leads.filter(status="CONVERTED").count()
+            total_leads = lead_stats["total"]
+            qualified_leads = lead_stats["qualified"]
+            converted_leads = lead_stats["converted"]
 
             qualification_rate = (
                 (qualified_leads / total_leads * 100) if total_leads > 0 else 0
@@ -593,12 +837,12 @@ class ProviderAnalyticsService:
                 (converted_leads / total_leads * 100) if total_leads > 0 else 0
             )
 
-            stats = {
+            return {
                 "provider_id": provider_id,
                 "name": provider.name,
                 "status": provider.status,
                 "total_leads": total_leads,
-                "leads_this_month": leads_this_month.count(),
+                "leads_this_month": lead_stats["this_month"],
                 "qualified_leads": qualified_leads,
                 "converted_leads": converted_leads,
                 "qualification_rate": round(qualification_rate, 2),
@@ -608,39 +852,115 @@ class ProviderAnalyticsService:
                     float(provider.total_paid / total_leads) if total_leads > 0 else 0
                 ),
                 "rating": provider.rating or 0,
-                "coverage_count": provider.coverage.count(),
+                "coverage_count": provider.coverage_count,
             }
 
-            return stats
-
-        except Provider.DoesNotExist:
-            return None
+        return CacheHelper.get_or_compute(
+            ProviderAnalyticsService.stats_cache_key(provider_id),
+            build,
+            timeout=ProviderAnalyticsService.STATS_CACHE_TTL,
+        )
 
     @staticmethod
     def get_top_providers(limit=10):
         """
         Get top providers by rating and leads.
 
+        Served from the precomputed ProviderLeaderboard table, which the
+        refresh_provider_leaderboard task rebuilds every few minutes -
+        an indexed ORDER BY + LIMIT instead of aggregating every lead on
+        each call. Falls back to a live computation until the first
+        refresh has run.
+
         Args:
             limit: Number of providers to return
 
         Returns:
             List of top providers with stats
         """
-        from apps.providers.models import Provider
-        from apps.leads.models import Lead
+        rows = list(
+            ProviderLeaderboard.objects.order_by("-rating", "-lead_count").values_list(
+                "stats", flat=True
+            )[:limit]
+        )
+        if rows:
+            return rows
+
+        return ProviderAnalyticsService.compute_top_provider_stats(limit=limit)
+
+    @staticmethod
+    def compute_top_provider_stats(limit=None):
+        """
+        Compute ranked stats for ACTIVE providers from live data.
+
+        Used by the leaderboard refresh task (no limit) and as the
+        get_top_providers fallback before the first refresh.
+
+        Args:
+            limit: Optional cap on the number of providers ranked
+
+        Returns:
+            List of stats dicts, best provider first
+        """
 
-        providers = (
-            Provider.objects.filter(status="ACTIVE")
-            .annotate(lead_count=Count("leads"), avg_rating=Avg("rating"))
-            .order_by("-avg_rating", "-lead_count")[:limit]
+        # Lead.provider_id is a plain integer (no reverse relation until
+        # the Phase 2 FK), so lead stats come from one grouped aggregate
+        # over the selected ids instead of a per-provider service call -
+        # three queries total regardless of limit
+        # coverage_count is the maintained column on Provider now, so no
+        # coverage join is needed here
+        providers_qs = Provider.objects.filter(status="ACTIVE").order_by(
+            F("rating").desc(nulls_last=True), "-total_leads_received"
         )
+        if limit is not None:
+            providers_qs = providers_qs[:limit]
+        providers = list(providers_qs)
+
+        cutoff = timezone.now() - timedelta(days=30)
+        lead_stats = {
+            row["provider_id"]: row
+            for row in Lead.objects.filter(
+                provider_id__in=[p.id for p in providers]
+            )
+            .values("provider_id")
+            .annotate(
+                total=Count("id"),
+                this_month=Count("id", filter=Q(created_at__gte=cutoff)),
+                qualified=Count("id", filter=Q(status="QUALIFIED")),
+                converted=Count("id", filter=Q(status="CONVERTED")),
+            )
+        }
 
+        empty = {"total": 0, "this_month": 0, "qualified": 0, "converted": 0}
         top_providers = []
         for provider in providers:
-            stats = ProviderAnalyticsService.get_provider_stats(provider.id)
-            if stats:
-                top_providers.append(stats)
+            row = lead_stats.get(provider.id, empty)
+            total_leads = row["total"]
+            top_providers.append(
+                {
+                    "provider_id": provider.id,
+                    "name": provider.name,
+                    "status": provider.status,
+                    "total_leads": total_leads,
+                    "leads_this_month": row["this_month"],
+                    "qualified_leads": row["qualified"],
+                    "converted_leads": row["converted"],
+                    "qualification_rate": round(
+                        (row["qualified"] / total_leads * 100) if total_leads else 0, 2
+                    ),
+                    "conversion_rate": round(
+                        (row["converted"] / total_leads * 100) if total_leads else 0, 2
+                    ),
+                    # float so the payload round-trips through the
+                    # leaderboard's JSON column
+                    "total_revenue": float(provider.total_paid),
+                    "average_lead_value": (
+                        float(provider.total_paid / total_leads) if total_leads else 0
+                    ),
+                    "rating": provider.rating or 0,
+                    "coverage_count": provider.coverage_count,
+                }
+            )
 
         return top_providers
 
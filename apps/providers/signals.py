@@ -0,0 +1,96 @@
+"""
+Provider App Signals
+====================
+Event-driven cache invalidation.
+
+ProviderMatchingService caches the best-provider id per (service, city)
+pair for a short TTL. These receivers drop the affected entries the
+moment a provider or its coverage changes, so routing never sends leads
+to a provider that just paused or lost a city; the TTL remains as a
+safety net.
+
+The per-provider details/stats payloads cached by ProviderService and
+ProviderAnalyticsService are invalidated the same way.
+"""
+
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.leads.models import Lead
+from apps.providers.models import Provider, ProviderCoverage
+
+
+def _invalidate_provider_reads(provider_id):
+    """Drop the cached details and stats payloads for one provider"""
+    from apps.providers.service import ProviderAnalyticsService, ProviderService
+
+    cache.delete_many(
+        [
+            ProviderService.details_cache_key(provider_id),
+            ProviderService.details_json_cache_key(provider_id),
+            ProviderAnalyticsService.stats_cache_key(provider_id),
+        ]
+    )
+
+
+@receiver(post_save, sender=Provider)
+def invalidate_match_on_provider_save(sender, instance, **kwargs):
+    """Drop cached matches for every pair this provider covers"""
+    from apps.leads.services import ProviderMatchingService
+
+    keys = [
+        ProviderMatchingService.match_cache_key(service, city)
+        for service, city in instance.coverage.values_list("service", "city")
+    ]
+    if keys:
+        cache.delete_many(keys)
+
+    _invalidate_provider_reads(instance.id)
+
+
+@receiver(post_save, sender=ProviderCoverage)
+@receiver(post_delete, sender=ProviderCoverage)
+def invalidate_match_on_coverage_change(sender, instance, **kwargs):
+    """Drop the cached match for a changed service-city pair"""
+    from apps.leads.services import ProviderMatchingService
+
+    cache.delete(
+        ProviderMatchingService.match_cache_key(instance.service, instance.city)
+    )
+
+    _invalidate_provider_reads(instance.provider_id)
+
+
+@receiver(post_save, sender=ProviderCoverage)
+def increment_coverage_count(sender, instance, created=False, **kwargs):
+    """Keep the provider's denormalized coverage counter in step"""
+    if created:
+        Provider.objects.filter(pk=instance.provider_id).update(
+            coverage_count=F("coverage_count") + 1
+        )
+
+
+@receiver(post_delete, sender=ProviderCoverage)
+def decrement_coverage_count(sender, instance, **kwargs):
+    """Keep the provider's denormalized coverage counter in step"""
+    Provider.objects.filter(
+        pk=instance.provider_id, coverage_count__gt=0
+    ).update(coverage_count=F("coverage_count") - 1)
+
+
+@receiver(post_save, sender=Lead)
+def invalidate_stats_on_lead_save(sender, instance, **kwargs):
+    """Drop cached stats for the provider a saved lead belongs to"""
+    if instance.provider_id:
+        _invalidate_provider_reads(instance.provider_id)
+
+
+__all__ = [
+    "invalidate_match_on_provider_save",
+    "invalidate_match_on_coverage_change",
+    "increment_coverage_count",
+    "decrement_coverage_count",
+    "invalidate_stats_on_lead_save",
+]
@@ -0,0 +1,85 @@
+"""
+Providers App Tasks
+===================
+Celery tasks for provider onboarding I/O.
+
+Verification SMS sends are external HTTPS round-trips; batching them on
+a worker keeps onboarding views fast and amortises the per-call cache
+and SMS-gateway overhead across the batch.
+"""
+
+from celery import shared_task
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def send_verification_codes(provider_ids):
+    """
+    Send phone verification codes to a batch of providers.
+
+    Args:
+        provider_ids: List of Provider primary keys
+
+    Returns:
+        dict with per-batch send counts
+    """
+    from apps.providers.service import ProviderVerificationService
+
+    return ProviderVerificationService.send_phone_verification_batch(provider_ids)
+
+
+@shared_task
+def refresh_provider_leaderboard():
+    """
+    Recompute the precomputed top-provider ranking.
+
+    Runs on a beat schedule; get_top_providers serves straight from the
+    ProviderLeaderboard table this task maintains.
+
+    Returns:
+        dict with the number of rows written
+    """
+    from django.utils import timezone
+
+    from apps.providers.models import ProviderLeaderboard
+    from apps.providers.service import ProviderAnalyticsService
+
+    stats_rows = ProviderAnalyticsService.compute_top_provider_stats()
+    now = timezone.now()
+
+    rows = [
+        ProviderLeaderboard(
+            provider_id=stats["provider_id"],
+            rating=stats["rating"],
+            lead_count=stats["total_leads"],
+            stats=stats,
+            computed_at=now,
+        )
+        for stats in stats_rows
+    ]
+
+    # One upsert for the batch, then drop providers no longer ranked
+    # (paused/deactivated since the last run)
+    ProviderLeaderboard.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["provider"],
+        update_fields=["rating", "lead_count", "stats", "computed_at"],
+    )
+    removed, _ = ProviderLeaderboard.objects.exclude(
+        provider_id__in=[row.provider_id for row in rows]
+    ).delete()
+
+    logger.info(
+        "Leaderboard refreshed: %s rows, %s removed", len(rows), removed
+    )
+
+    return {"rows": len(rows), "removed": removed}
+
+
+__all__ = [
+    "send_verification_codes",
+    "refresh_provider_leaderboard",
+]
@@ -0,0 +1,76 @@
+"""
+Queue-based logging plumbing.
+
+The RotatingFileHandlers used to sit directly on the loggers, so every
+logger.info() in a request thread paid for formatting, the file write
+and any rotation while holding the handler lock. Loggers now feed
+LOG_QUEUE through a QueueHandler (a plain enqueue), and a single
+QueueListener thread owns the file handlers and does the actual I/O.
+
+LOG_QUEUE is referenced from settings.LOGGING via
+"ext://config.logconf.LOG_QUEUE"; the listener is started once per
+process from CoreConfig.ready().
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+# Unbounded so a slow disk can never block a request thread
+LOG_QUEUE = queue.SimpleQueue()
+
+_VERBOSE_FORMATTER = logging.Formatter(
+    "{levelname} {asctime} {module} {process:d} {thread:d} {message}",
+    style="{",
+)
+
+_listener = None
+
+
+def _is_celery_record(record):
+    """Route celery.* records to celery.log, everything else to fitvantage.log"""
+    return record.name == "celery" or record.name.startswith("celery.")
+
+
+def _build_listener(logs_dir):
+    """Create the listener owning the rotating file handlers"""
+    app_handler = logging.handlers.RotatingFileHandler(
+        logs_dir / "fitvantage.log",
+        maxBytes=1024 * 1024 * 10,  # 10 MB
+        backupCount=5,
+    )
+    app_handler.setLevel(logging.INFO)
+    app_handler.setFormatter(_VERBOSE_FORMATTER)
+    app_handler.addFilter(lambda record: not _is_celery_record(record))
+
+    celery_handler = logging.handlers.RotatingFileHandler(
+        logs_dir / "celery.log",
+        maxBytes=1024 * 1024 * 10,  # 10 MB
+        backupCount=5,
+    )
+    celery_handler.setLevel(logging.INFO)
+    celery_handler.setFormatter(_VERBOSE_FORMATTER)
+    celery_handler.addFilter(_is_celery_record)
+
+    return logging.handlers.QueueListener(
+        LOG_QUEUE,
+        app_handler,
+        celery_handler,
+        respect_handler_level=True,
+    )
+
+
+def start_listener():
+    """Start the listener thread once per process (idempotent)"""
+    global _listener
+
+    if _listener is None:
+        from django.conf import settings
+
+        _listener = _build_listener(settings.LOGS_DIR)
+        _listener.start()
+        # Drain anything still queued when the process exits
+        atexit.register(_listener.stop)
+
+    return _listener
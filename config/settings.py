@@ -139,24 +139,32 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # FITVANTAGE SPECIFIC SETTINGS
 # ============================================================================
 
-# Cache configuration (for product caching)
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "fitvantage-cache",
+# Cache configuration. Anything multi-process must share one cache:
+# verification codes, match entries and invalidations written by one
+# worker have to be visible to every other worker, which the per-process
+# LocMem backend cannot provide. Set REDIS_URL in any deployed
+# environment; LocMem remains only as a zero-dependency fallback for
+# single-process development.
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": REDIS_URL,
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                "CONNECTION_POOL_KWARGS": {"max_connections": 50},
+            },
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "fitvantage-cache",
+        }
     }
-}
-
-# For production, use Redis:
-# CACHES = {
-#     'default': {
-#         'BACKEND': 'django_redis.cache.RedisCache',
-#         'LOCATION': 'redis://127.0.0.1:6379/1',
-#         'OPTIONS': {
-#             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
-#         }
-#     }
-# }
 
 # Celery Configuration
 CELERY_BROKER_URL = "redis://localhost:6379/0"
@@ -166,20 +174,34 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
 
-# Celery Beat Schedule (for cron jobs)
+# Celery Beat Schedule (for cron jobs). Task names must match the
+# registered names (shared_task registers under the full module path,
+# e.g. apps.core.tasks.*) or beat dispatches to a task nobody runs.
 CELERY_BEAT_SCHEDULE = {
     "refresh-affiliate-products-top-categories": {
-        "task": "core.tasks.refresh_affiliate_products",
+        "task": "apps.core.tasks.refresh_affiliate_products",
         "schedule": 86400.0,  # Every 24 hours (86400 seconds)
         "kwargs": {"tier": "top"},
     },
     "refresh-affiliate-products-other-categories": {
-        "task": "core.tasks.refresh_affiliate_products",
+        "task": "apps.core.tasks.refresh_affiliate_products",
         "schedule": 604800.0,  # Every 7 days (604800 seconds)
         "kwargs": {"tier": "other"},
     },
+    "flush-post-view-counts": {
+        "task": "apps.core.tasks.flush_view_counts",
+        "schedule": 60.0,  # Every minute
+    },
+    "refresh-provider-leaderboard": {
+        "task": "apps.providers.tasks.refresh_provider_leaderboard",
+        "schedule": 300.0,  # Every 5 minutes
+    },
 }
 
+# Concurrent Amazon API fetches during a product refresh run. The calls
+# are I/O-bound; raise this once real PA-API rate limits are known.
+REFRESH_CONCURRENCY = int(os.getenv("REFRESH_CONCURRENCY", "5"))
+
 # Amazon API Settings
 AMAZON_API_KEY = os.getenv("AMAZON_API_KEY", "")
 AMAZON_SECRET_KEY = os.getenv("AMAZON_SECRET_KEY", "")
@@ -201,7 +223,10 @@ TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID", "")
 TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN", "")
 TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER", "")
 
-# Logging Configuration
+# Logging Configuration. File writes go through a queue: loggers only
+# enqueue records, and the QueueListener thread in config.logconf (one
+# per process, started from CoreConfig.ready) owns the rotating file
+# handlers, so request threads never wait on disk I/O or rotation.
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -229,36 +254,24 @@ LOGGING = {
             "class": "logging.StreamHandler",
             "formatter": "simple",
         },
-        "file": {
-            "level": "INFO",
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": LOGS_DIR / "fitvantage.log",
-            "maxBytes": 1024 * 1024 * 10,  # 10 MB
-            "backupCount": 5,
-            "formatter": "verbose",
-        },
-        "celery": {
-            "level": "INFO",
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": LOGS_DIR / "celery.log",
-            "maxBytes": 1024 * 1024 * 10,  # 10 MB
-            "backupCount": 5,
-            "formatter": "verbose",
+        "queue": {
+            "class": "logging.handlers.QueueHandler",
+            "queue": "ext://config.logconf.LOG_QUEUE",
         },
     },
     "loggers": {
         "django": {
-            "handlers": ["console", "file"],
+            "handlers": ["console", "queue"],
             "level": "INFO",
             "propagate": True,
         },
         "celery": {
-            "handlers": ["console", "celery"],
+            "handlers": ["console", "queue"],
             "level": "INFO",
             "propagate": True,
         },
         "fitvantage": {
-            "handlers": ["console", "file"],
+            "handlers": ["console", "queue"],
             "level": "DEBUG",
             "propagate": True,
         },